@@ -78,6 +78,8 @@ class MainWindow(QMainWindow):
             self.setGeometry(100, 100, 1200, 800)
 
     def closeEvent(self, event):
+        if self.booklet_processor:
+            self.booklet_processor.close()
         self.settings.setValue("window/geometry", self.saveGeometry())
         self.save_advanced_options_settings()
         event.accept()
@@ -262,6 +264,8 @@ class MainWindow(QMainWindow):
         """Reset all PDF-related state and UI."""
         self.current_pdf_path = None
         self._is_pdf_open = False
+        if self.booklet_processor:
+            self.booklet_processor.close()
         self.booklet_processor = None
         self.current_booklet_page = 0
         self.current_preview_dpi = 72
@@ -868,6 +872,9 @@ class MainWindow(QMainWindow):
     # ---------------- Processing Handlers ----------------
     def processing_finished_handler(self, processor: BookletProcessor):
         """Called when the worker finishes processing the opened PDF."""
+        # Release the previously opened document before replacing it
+        if self.booklet_processor and self.booklet_processor is not processor:
+            self.booklet_processor.close()
         self.booklet_processor = processor
 
         # Reset General Options to defaults
@@ -998,16 +1005,9 @@ class MainWindow(QMainWindow):
             page_idx = idx_b
 
         if page_idx >= 0:
-            # Get ONLY the per-page delta (NOT merged with global)
-            if page_idx in self.booklet_processor.transform_manager.page_transforms:
-                transform = self.booklet_processor.transform_manager.page_transforms[
-                    page_idx
-                ]
-            else:
-                # No per-page transform exists, show identity/zero values
-                from ..logic.page_transforms import Transform
-
-                transform = Transform()
+            # Get ONLY the per-page delta (NOT merged with global); identity
+            # values when no per-page transform exists
+            transform = self.booklet_processor.get_page_only_transform(page_idx)
             # Block signals and update UI
             self.page_options_widget.blockSignals(True)
 
@@ -82,6 +82,10 @@ class PreviewViewerWidget(QWidget):
         self._update_pixmap_display()
         self.page_side_selected.emit(self.current_page_index, self.selected_side)
 
+        # Warm the cache for the neighbouring pages while the user looks
+        if self.processor:
+            self.processor.prefetch_adjacent(page_index, dpi)
+
     def _handle_label_click(self, click_pos: QPointF, pixmap_with_overlays: QPixmap):
         """Handle click: detect mode, map to region, toggle selection."""
         if not self.processor:
@@ -6,13 +6,31 @@ Maintains state and coordinates between the three specialized modules.
 """
 
 from typing import Callable, Optional, Tuple
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QPixmap, QPixmapCache
 
 from .booklet_layout import BookletLayout
 from .pdf_renderer import PDFRenderer
 from .pdf_saver import PDFSaver
 from .page_transforms import PageTransformManager, Transform, create_transform_from_gui
 
+# Preview cache budget in KB (100 MiB) - enough for several high-DPI spreads
+QPixmapCache.setCacheLimit(102400)
+
+# Millimetres to PostScript points (1 inch = 25.4 mm = 72 pt)
+_MM_TO_PT = 72.0 / 25.4
+
+# Preset output sizes in points (always stored as portrait)
+_PRESETS_PT = {
+    name: (w_mm * _MM_TO_PT, h_mm * _MM_TO_PT)
+    for name, (w_mm, h_mm) in {
+        "a4": (210, 297),
+        "a3": (297, 420),
+        "letter": (216, 279),
+        "legal": (216, 356),
+        "tabloid": (279, 432),
+    }.items()
+}
+
 
 class BookletProcessor:
     """
@@ -35,9 +53,13 @@ class BookletProcessor:
         """
         self.pdf_path = file_path
 
-        # Get page count and original page size
-        self.original_page_count = PDFRenderer.get_page_count(file_path)
-        page_size = PDFRenderer.get_page_size_mm(file_path)
+        # Initialize renderer (keeps PDF open for performance)
+        self.renderer = PDFRenderer(file_path)
+        self._closed = False
+
+        # Get page count and original page size from the open document
+        self.original_page_count = self.renderer.page_count
+        page_size = self.renderer.page_size_mm
         self._original_page_size_mm = page_size if page_size else (210.0, 297.0)
 
         # Initialize layout generator
@@ -46,16 +68,13 @@ class BookletProcessor:
         # Initialize transformation manager
         self.transform_manager = PageTransformManager(self.original_page_count)
 
-        # Initialize renderer (keeps PDF open for performance)
-        self.renderer = PDFRenderer(file_path)
-
         # Default to booklet mode
         self.layout.generate_booklet_layout()
 
         # Default output dimensions (in points) - store SINGLE page dimensions
         # Rendering and saving will adjust based on mode
-        original_rect_width = self._original_page_size_mm[0] * 72 / 25.4
-        original_rect_height = self._original_page_size_mm[1] * 72 / 25.4
+        original_rect_width = self._original_page_size_mm[0] * _MM_TO_PT
+        original_rect_height = self._original_page_size_mm[1] * _MM_TO_PT
         self.output_width = original_rect_width
         self.output_height = original_rect_height
 
@@ -64,14 +83,25 @@ class BookletProcessor:
         """Get the current active mode from the layout."""
         return self.layout.active_mode
 
-    def __del__(self):
-        """Cleanup renderer on deletion."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
+        return False
 
     def close(self):
-        """Close the renderer and release resources."""
-        if hasattr(self, "renderer") and self.renderer:
-            self.renderer.close()
+        """
+        Close the renderer and release resources.
+
+        Safe to call more than once. Call explicitly (or use the processor as
+        a context manager) rather than relying on garbage collection, which
+        may keep the source document open long after it is replaced.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.renderer.close()
 
     # ==================== Layout Management ====================
 
@@ -130,6 +160,10 @@ class BookletProcessor:
         if page_index < 0 or page_index >= self.layout.get_layout_count():
             return QPixmap()
 
+        # Pick up external edits to the source file; the new file signature
+        # keeps renders of the old version out of the cache lookup below
+        self.renderer.reopen_if_changed()
+
         # Get page indices from layout
         idx_a, idx_b = self.layout.get_page_indices(page_index)
 
@@ -137,8 +171,14 @@ class BookletProcessor:
         transform_a = self.get_transform_for_page(idx_a) if idx_a >= 0 else None
         transform_b = self.get_transform_for_page(idx_b) if idx_b >= 0 else None
 
+        # Reuse a previous render if nothing that affects the output changed
+        cache_key = self._render_cache_key(idx_a, idx_b, dpi, transform_a, transform_b)
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
         # Delegate to renderer with transforms
-        return self.renderer.render_page(
+        pixmap = self.renderer.render_page(
             idx_a,
             idx_b,
             self.layout.active_mode,
@@ -149,6 +189,94 @@ class BookletProcessor:
             transform_b,
         )
 
+        if not pixmap.isNull():
+            QPixmapCache.insert(cache_key, pixmap)
+
+        return pixmap
+
+    def prefetch_adjacent(self, page_index: int, dpi: int):
+        """
+        Render the previous and next page/spread in the background so that
+        paging through the preview hits the cache.
+
+        Args:
+            page_index: Index in the layout map of the page being shown
+            dpi: Resolution the preview is rendered at
+        """
+        for neighbour in (page_index + 1, page_index - 1):
+            if neighbour < 0 or neighbour >= self.layout.get_layout_count():
+                continue
+
+            idx_a, idx_b = self.layout.get_page_indices(neighbour)
+            transform_a = self.get_transform_for_page(idx_a) if idx_a >= 0 else None
+            transform_b = self.get_transform_for_page(idx_b) if idx_b >= 0 else None
+
+            cache_key = self._render_cache_key(
+                idx_a, idx_b, dpi, transform_a, transform_b
+            )
+            if QPixmapCache.find(cache_key) is not None:
+                continue
+
+            self.renderer.prefetch(
+                cache_key,
+                idx_a,
+                idx_b,
+                self.layout.active_mode,
+                dpi,
+                self.output_width,
+                self.output_height,
+                transform_a,
+                transform_b,
+            )
+
+    def _render_cache_key(
+        self,
+        idx_a: int,
+        idx_b: int,
+        dpi: int,
+        transform_a: Optional[Transform],
+        transform_b: Optional[Transform],
+    ) -> str:
+        """Build the QPixmapCache key for a rendered page/spread."""
+        key_a = self._quantized_transform_key(transform_a, dpi)
+        key_b = self._quantized_transform_key(transform_b, dpi)
+        return (
+            f"{self.pdf_path}:{self.renderer.file_sig}:"
+            f"{self.layout.active_mode}:{idx_a}:{idx_b}:{dpi}:"
+            f"{key_a}:{key_b}:"
+            f"{int(self.output_width)}x{int(self.output_height)}"
+        )
+
+    @staticmethod
+    def _quantized_transform_key(transform: Optional[Transform], dpi: int) -> tuple:
+        """
+        Reduce a transform to what the renderer can distinguish at this DPI,
+        so float jitter (e.g. 0.0 vs -0.0, or sub-pixel shift differences
+        while dragging) still hits the cache.
+
+        Args:
+            transform: Transform for the page, or None
+            dpi: Resolution the preview is rendered at
+
+        Returns:
+            Hashable tuple; None and identity transforms share one key
+        """
+        if transform is None or transform.is_identity():
+            return ()
+
+        # Shifts are truncated to whole pixels exactly as the renderer does
+        mm_to_px = _MM_TO_PT * (dpi / 72.0)
+        return (
+            int(transform.h_shift_mm * mm_to_px),
+            int(transform.v_shift_mm * mm_to_px),
+            round(transform.rotation_deg % 360, 2) + 0.0,
+            transform.h_flip,
+            transform.v_flip,
+            round(transform.scale_percent, 2) + 0.0,
+            round(transform.h_scale_percent, 2) + 0.0,
+            round(transform.v_scale_percent, 2) + 0.0,
+        )
+
     # ==================== Saving ====================
 
     def save_booklet(
@@ -244,8 +372,8 @@ class BookletProcessor:
         """
         # Get original page dimensions in points
         original_w_mm, original_h_mm = self._original_page_size_mm
-        original_w_pt = original_w_mm * 72 / 25.4
-        original_h_pt = original_h_mm * 72 / 25.4
+        original_w_pt = original_w_mm * _MM_TO_PT
+        original_h_pt = original_h_mm * _MM_TO_PT
 
         if output_size == "automatic":
             # Use original page dimensions
@@ -266,23 +394,16 @@ class BookletProcessor:
                 )
 
         elif isinstance(output_size, str):
-            # Preset sizes in mm (always stored as portrait)
-            presets_mm = {
-                "a4": (210, 297),
-                "a3": (297, 420),
-                "letter": (216, 279),
-                "legal": (216, 356),
-                "tabloid": (279, 432),
-            }
-            if output_size.lower() in presets_mm:
-                w_mm, h_mm = presets_mm[output_size.lower()]
-
-                # Apply orientation to preset BEFORE converting to points
+            preset = _PRESETS_PT.get(output_size.lower())
+            if preset is not None:
+                w_pt, h_pt = preset
+
+                # Presets are portrait; swap for landscape
                 if orientation == "landscape":
-                    w_mm, h_mm = h_mm, w_mm  # Swap for landscape
+                    w_pt, h_pt = h_pt, w_pt
 
-                self.output_width = w_mm * 72 / 25.4
-                self.output_height = h_mm * 72 / 25.4
+                self.output_width = w_pt
+                self.output_height = h_pt
             else:
                 # Unknown preset, keep original
                 self.output_width = original_w_pt
@@ -293,8 +414,8 @@ class BookletProcessor:
             w, h, unit = output_size
 
             if unit == "mm":
-                self.output_width = w * 72 / 25.4
-                self.output_height = h * 72 / 25.4
+                self.output_width = w * _MM_TO_PT
+                self.output_height = h * _MM_TO_PT
             elif unit == "in":
                 self.output_width = w * 72
                 self.output_height = h * 72
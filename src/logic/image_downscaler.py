@@ -6,87 +6,385 @@ Downsamples raster images in PDFs to reduce file size while preserving vectors.
 
 from PIL import Image
 import io
+import math
+import time
 from pypdf import PdfWriter
-from pypdf.generic import NameObject, DictionaryObject, NumberObject
-from typing import Optional
+from pypdf.generic import (
+    ContentStream,
+    NameObject,
+    DictionaryObject,
+    IndirectObject,
+    NumberObject,
+)
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+# PDF transformation matrix (a, b, c, d, e, f) that leaves coordinates unchanged
+_IDENTITY_MATRIX = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
 
 
 class ImageDownscaler:
     """Handles downsampling of raster images in PDFs."""
 
+    # Encoder settings used when no explicit options are passed down
+    DEFAULT_JPEG_OPTIONS = {
+        "quality": 85,
+        "optimize": False,
+        "subsampling": 2,
+        "progressive": False,
+    }
+
     @staticmethod
     def downsample_images_in_writer(
         writer: PdfWriter,
         target_dpi: int = 300,
         progress_callback: Optional[callable] = None,
+        jpeg_quality: int = 85,
+        jpeg_optimize: bool = False,
+        jpeg_subsampling: int = 2,
+        workers: int = 1,
     ):
         """
         Downsample all images in a PdfWriter to target DPI.
 
+        Each distinct image is resampled once, however many pages or Form
+        XObjects reference it. With workers > 1 the decode/resize/encode work
+        runs in a thread pool (Pillow releases the GIL for it); the writer
+        itself is only modified on the calling thread.
+
         Args:
             writer: PdfWriter object with pages to process
             target_dpi: Target DPI for images (default 300)
             progress_callback: Optional callback(percent, message)
+            jpeg_quality: JPEG quality for re-encoded images (default 85)
+            jpeg_optimize: Run the extra Huffman optimization pass (slower,
+                slightly smaller files)
+            jpeg_subsampling: Chroma subsampling (0=4:4:4, 1=4:2:2, 2=4:2:0)
+            workers: Number of threads resampling images in parallel
         """
-        total_pages = len(writer.pages)
-
-        for page_num, page in enumerate(writer.pages):
+        # Text and vector-only documents have nothing to resample; skip
+        # parsing every content stream to measure image placements
+        if not ImageDownscaler._has_any_image(writer):
             if progress_callback:
-                percent = int((page_num / total_pages) * 100)
-                progress_callback(
-                    percent, f"Downsampling images on page {page_num + 1}..."
-                )
+                progress_callback(100, "No images to downsample")
+            return
 
-            # Process images on this page
-            ImageDownscaler._process_page_images(page, target_dpi)
+        seen_forms = set()
+        jpeg_options = {
+            "quality": jpeg_quality,
+            "optimize": jpeg_optimize,
+            "subsampling": jpeg_subsampling,
+            "progressive": False,
+        }
+
+        # Find how large each image is actually drawn on the output sheets
+        image_extents = ImageDownscaler._collect_image_extents(writer)
+        resampled_cache = {}
+
+        # Gather every distinct image first: (xobjects dict, name, image)
+        jobs = []
+        seen_images = set()
+        for page in writer.pages:
+            ImageDownscaler._process_page_images(page, seen_forms, seen_images, jobs)
+
+        def resample(job):
+            _, _, image_obj = job
+            return ImageDownscaler._resample_image(
+                image_obj,
+                target_dpi,
+                jpeg_options,
+                image_extents.get(id(image_obj)),
+                resampled_cache,
+            )
+
+        pool = None
+        if workers > 1 and len(jobs) > 1:
+            pool = ThreadPoolExecutor(max_workers=min(workers, len(jobs)))
+            results = pool.map(resample, jobs)
+        else:
+            results = map(resample, jobs)
+
+        # Throttle progress updates: each one crosses into the GUI thread
+        last_percent = -1
+        last_time = 0.0
+
+        try:
+            for done, (job, result) in enumerate(zip(jobs, results)):
+                if progress_callback:
+                    percent = done * 100 // len(jobs)
+                    now = time.monotonic()
+                    if percent != last_percent and now - last_time > 0.05:
+                        progress_callback(
+                            percent, f"Downsampling image {done + 1} of {len(jobs)}..."
+                        )
+                        last_percent = percent
+                        last_time = now
+
+                if result is not None:
+                    xobjects, obj_name, image_obj = job
+                    ImageDownscaler._replace_image(
+                        writer, xobjects, obj_name, image_obj, *result
+                    )
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
         if progress_callback:
             progress_callback(100, "Image downsampling complete")
 
     @staticmethod
-    def _process_page_images(page, target_dpi: int):
-        """Process all images on a single page."""
+    def _has_any_image(writer: PdfWriter) -> bool:
+        """
+        Check whether any page draws an Image XObject.
+
+        Only resource dictionaries are inspected - no content streams are
+        parsed and no image data is decoded - and the walk stops at the
+        first image found.
+        """
+        seen_forms = set()
+        stack = [page["/Resources"] for page in writer.pages if "/Resources" in page]
+
+        while stack:
+            try:
+                resources = stack.pop().get_object()
+                if not resources or "/XObject" not in resources:
+                    continue
+
+                for obj in resources["/XObject"].get_object().values():
+                    obj = obj.get_object()
+                    subtype = obj.get("/Subtype")
+                    if subtype == "/Image":
+                        return True
+                    if subtype == "/Form" and id(obj) not in seen_forms:
+                        seen_forms.add(id(obj))
+                        if "/Resources" in obj:
+                            stack.append(obj["/Resources"])
+            except Exception:
+                # Unreadable resources: let the full walk decide
+                return True
+
+        return False
+
+    @staticmethod
+    def _process_page_images(
+        page,
+        seen_forms: set,
+        seen_images: set,
+        jobs: list,
+    ):
+        """Collect all images on a single page."""
         # Check if page has resources
         if "/Resources" not in page:
             return
 
-        # Process images recursively (including those inside Form XObjects)
-        ImageDownscaler._process_resources(page["/Resources"], target_dpi)
+        # Collect images including those nested inside Form XObjects
+        ImageDownscaler._process_resources(
+            page["/Resources"], seen_forms, seen_images, jobs
+        )
 
     @staticmethod
-    def _process_resources(resources, target_dpi: int):
-        """Recursively process resources to find and downsample images."""
-        if not resources or "/XObject" not in resources:
-            return
+    def _process_resources(
+        resources,
+        seen_forms: set,
+        seen_images: set,
+        jobs: list,
+    ):
+        """
+        Walk resources to find images, appending (xobjects dict, name, image)
+        to jobs for each image not already in seen_images.
 
-        xobjects = resources["/XObject"].get_object()
+        Nested Form XObjects are handled with an explicit stack rather than
+        recursion. A Form shared by several pages (or nested several times)
+        is only walked once per seen_forms set.
+        """
+        stack = [resources]
+        while stack:
+            resources = stack.pop()
+            if not resources or "/XObject" not in resources:
+                continue
+
+            xobjects = resources["/XObject"].get_object()
+
+            for obj_name in list(xobjects.keys()):
+                raw = xobjects.raw_get(obj_name)
+                obj = xobjects[obj_name]
 
-        for obj_name in list(xobjects.keys()):
-            obj = xobjects[obj_name]
+                if not (isinstance(obj, dict) or hasattr(obj, "get_object")):
+                    continue
 
-            if isinstance(obj, dict) or hasattr(obj, "get_object"):
                 obj = obj.get_object() if hasattr(obj, "get_object") else obj
 
                 subtype = obj.get("/Subtype") or obj.get(NameObject("/Subtype"))
 
                 if subtype == "/Image" or subtype == NameObject("/Image"):
-                    # This is an actual image
-                    ImageDownscaler._downsample_image(
-                        xobjects, obj_name, obj, target_dpi
-                    )
+                    # Shared images are referenced by object number, which
+                    # survives the in-place swap when the image is replaced
+                    if isinstance(raw, IndirectObject):
+                        image_key = (raw.idnum, raw.generation)
+                    else:
+                        image_key = id(obj)
+                    if image_key in seen_images:
+                        continue
+                    seen_images.add(image_key)
+
+                    jobs.append((xobjects, obj_name, obj))
 
                 elif subtype == "/Form" or subtype == NameObject("/Form"):
                     # This is a Form XObject - check inside it for images
+                    if id(obj) in seen_forms:
+                        continue
+                    seen_forms.add(id(obj))
+
                     if "/Resources" in obj:
-                        ImageDownscaler._process_resources(
-                            obj["/Resources"], target_dpi
-                        )
+                        stack.append(obj["/Resources"])
 
     @staticmethod
-    def _downsample_image(xobjects_dict, obj_name, image_obj, target_dpi: int):
+    def _collect_image_extents(writer: PdfWriter) -> dict:
         """
-        Downsample a single image if it exceeds target DPI.
-        Returns True if image was downsampled, False otherwise.
+        Find the largest size at which each image is drawn across all pages.
+
+        Returns:
+            Dict mapping id(image object) -> (width_pt, height_pt)
+        """
+        extents = {}
+        form_placements = {}
+
+        for page in writer.pages:
+            if "/Resources" not in page:
+                continue
+
+            placements = ImageDownscaler._image_placements(
+                page, page["/Resources"], writer, form_placements
+            )
+            for image, (a, b, c, d, _, _) in placements:
+                # The matrix maps the image's unit square onto the page
+                width_pt = math.hypot(a, b)
+                height_pt = math.hypot(c, d)
+
+                previous = extents.get(id(image))
+                if previous:
+                    width_pt = max(width_pt, previous[0])
+                    height_pt = max(height_pt, previous[1])
+                extents[id(image)] = (width_pt, height_pt)
+
+        return extents
+
+    @staticmethod
+    def _image_placements(content_owner, resources, pdf, form_placements: dict):
+        """
+        List every image drawn by a page or Form XObject content stream.
+
+        Nested Forms are parsed once and memoized in form_placements.
+        Content streams whose resources hold no XObjects are not parsed.
+
+        Returns:
+            List of (image object, matrix) pairs, where the matrix maps the
+            image's unit square into the owner's coordinate space
+        """
+        if not resources or "/XObject" not in resources:
+            return []
+
+        xobjects = resources["/XObject"].get_object()
+        if not xobjects:
+            return []
+
+        placements = []
+        try:
+            if hasattr(content_owner, "get_contents"):
+                contents = content_owner.get_contents()
+            else:
+                contents = ContentStream(content_owner, pdf)
+            if contents is None:
+                return []
+
+            ctm = _IDENTITY_MATRIX
+            saved_states = []
+
+            for operands, operator in contents.operations:
+                if operator == b"q":
+                    saved_states.append(ctm)
+                elif operator == b"Q":
+                    if saved_states:
+                        ctm = saved_states.pop()
+                elif operator == b"cm" and len(operands) == 6:
+                    ctm = ImageDownscaler._multiply_matrices(
+                        tuple(float(v) for v in operands), ctm
+                    )
+                elif operator == b"Do" and operands and operands[0] in xobjects:
+                    obj = xobjects[operands[0]].get_object()
+                    subtype = obj.get("/Subtype")
+
+                    if subtype == "/Image":
+                        placements.append((obj, ctm))
+
+                    elif subtype == "/Form":
+                        form_key = id(obj)
+                        if form_key not in form_placements:
+                            # Placeholder guards against self-referencing Forms
+                            form_placements[form_key] = []
+
+                            form_resources = (
+                                obj["/Resources"] if "/Resources" in obj else resources
+                            )
+                            form_matrix = (
+                                tuple(float(v) for v in obj["/Matrix"])
+                                if "/Matrix" in obj
+                                else _IDENTITY_MATRIX
+                            )
+                            form_placements[form_key] = [
+                                (
+                                    image,
+                                    ImageDownscaler._multiply_matrices(m, form_matrix),
+                                )
+                                for image, m in ImageDownscaler._image_placements(
+                                    obj, form_resources, pdf, form_placements
+                                )
+                            ]
+
+                        for image, m in form_placements[form_key]:
+                            placements.append(
+                                (image, ImageDownscaler._multiply_matrices(m, ctm))
+                            )
+        except Exception:
+            # Unparseable content - images fall back to the size heuristic
+            pass
+
+        return placements
+
+    @staticmethod
+    def _multiply_matrices(m: tuple, n: tuple) -> tuple:
+        """Return the PDF matrix product m x n (apply m first, then n)."""
+        a, b, c, d, e, f = m
+        a2, b2, c2, d2, e2, f2 = n
+        return (
+            a * a2 + b * c2,
+            a * b2 + b * d2,
+            c * a2 + d * c2,
+            c * b2 + d * d2,
+            e * a2 + f * c2 + e2,
+            e * b2 + f * d2 + f2,
+        )
+
+    @staticmethod
+    def _resample_image(
+        image_obj,
+        target_dpi: int,
+        jpeg_options: Optional[dict] = None,
+        rendered_size_pt: Optional[Tuple[float, float]] = None,
+        resampled_cache: Optional[dict] = None,
+    ) -> Optional[Tuple[bytes, NameObject, int, int]]:
+        """
+        Resample a single image if it exceeds target DPI. Does not modify
+        the document, so it may run on a worker thread.
+
+        When rendered_size_pt is known, the effective DPI is measured against
+        the size the image is drawn at. Otherwise the image is assumed to
+        fill at most an 11-inch print. Re-encoded data is shared through
+        resampled_cache, keyed by source bytes and target size.
+
+        Returns:
+            (jpeg_data, color_space, width, height), or None if the image is
+            left as it is
         """
         try:
             # Get image dimensions
@@ -94,12 +392,12 @@ class ImageDownscaler:
             height = image_obj.get("/Height")
 
             if not width or not height:
-                return False
+                return None
 
             # Get image data
             data = image_obj.get_data()
             if not data:
-                return False
+                return None
 
             # Determine image format
             filter_type = image_obj.get("/Filter")
@@ -116,51 +414,122 @@ class ImageDownscaler:
                     "/FlateDecode"
                 ):
                     # FlateDecode images have decoding/inversion issues - skip them
-                    return False
+                    return None
                 else:
                     # Unsupported filter - skip
-                    return False
+                    return None
 
             except Exception:
                 # Can't decode image - skip
-                return False
-
-            # Calculate target dimensions
-            max_print_size_inches = 11
-            target_pixels = int(max_print_size_inches * target_dpi)
+                return None
 
-            # Check if downsampling is needed
-            needs_downsample = max(width, height) > target_pixels
+            if rendered_size_pt and min(rendered_size_pt) > 0:
+                # Effective resolution on the sheet; the lower axis decides
+                width_pt, height_pt = rendered_size_pt
+                rendered_dpi = min(width * 72 / width_pt, height * 72 / height_pt)
 
-            if not needs_downsample:
-                return False
+                if rendered_dpi <= target_dpi:
+                    return None
 
-            # Calculate new dimensions maintaining aspect ratio
-            aspect_ratio = width / height
-            if width > height:
-                new_width = target_pixels
-                new_height = max(1, int(target_pixels / aspect_ratio))
+                scale = target_dpi / rendered_dpi
+                new_width = int(width * scale)
+                new_height = int(height * scale)
             else:
-                new_height = target_pixels
-                new_width = max(1, int(target_pixels * aspect_ratio))
+                # Calculate target dimensions
+                max_print_size_inches = 11
+                target_pixels = int(max_print_size_inches * target_dpi)
+
+                # Check if downsampling is needed
+                needs_downsample = max(width, height) > target_pixels
+
+                if not needs_downsample:
+                    return None
+
+                # Calculate new dimensions maintaining aspect ratio
+                aspect_ratio = width / height
+                if width > height:
+                    new_width = target_pixels
+                    new_height = max(1, int(target_pixels / aspect_ratio))
+                else:
+                    new_height = target_pixels
+                    new_width = max(1, int(target_pixels * aspect_ratio))
 
             # Safety check: ensure both dimensions are at least 1
             new_width = max(1, new_width)
             new_height = max(1, new_height)
 
-            # Downsample the image
-            downsampled = pil_image.resize(
-                (new_width, new_height), Image.Resampling.LANCZOS
+            # Identical image data scaled to the same size encodes to the same
+            # bytes; catalogs and forms often repeat one icon as many objects
+            cache_key = (data, new_width, new_height)
+            cached = (
+                resampled_cache.get(cache_key) if resampled_cache is not None else None
             )
+            if cached is not None:
+                new_data, color_space = cached
+            else:
+                # Keep grayscale and CMYK in their own colour space instead of
+                # expanding to RGB; convert before resizing so the resampler
+                # works on the final channel count
+                if pil_image.mode in ("1", "L"):
+                    if pil_image.mode == "1":
+                        pil_image = pil_image.convert("L")
+                    color_space = NameObject("/DeviceGray")
+                elif pil_image.mode == "CMYK":
+                    color_space = NameObject("/DeviceCMYK")
+                else:
+                    if pil_image.mode != "RGB":
+                        pil_image = pil_image.convert("RGB")
+                    color_space = NameObject("/DeviceRGB")
+
+                # Downsample the image. For heavy reductions a wide LANCZOS
+                # kernel is slow; box-reduce by the integer factor first and
+                # finish the fractional remainder with BICUBIC
+                src_width, src_height = pil_image.size
+                ratio = max(src_width / new_width, src_height / new_height)
+                if ratio > 3:
+                    # Never reduce below the target on either axis
+                    factor = min(src_width // new_width, src_height // new_height)
+                    reduced = pil_image.reduce(max(1, factor))
+                    downsampled = reduced.resize(
+                        (new_width, new_height), Image.Resampling.BICUBIC
+                    )
+                else:
+                    downsampled = pil_image.resize(
+                        (new_width, new_height), Image.Resampling.LANCZOS
+                    )
 
-            # Re-encode as JPEG (only DCTDecode images reach here)
-            output_buffer = io.BytesIO()
-            if downsampled.mode != "RGB":
-                downsampled = downsampled.convert("RGB")
-            downsampled.save(output_buffer, format="JPEG", quality=85, optimize=True)
-            new_filter = NameObject("/DCTDecode")
+                # Re-encode as JPEG (only DCTDecode images reach here)
+                output_buffer = io.BytesIO()
+                downsampled.save(
+                    output_buffer,
+                    format="JPEG",
+                    **(jpeg_options or ImageDownscaler.DEFAULT_JPEG_OPTIONS),
+                )
+                new_data = output_buffer.getvalue()
+
+                if resampled_cache is not None:
+                    resampled_cache[cache_key] = (new_data, color_space)
+
+            return new_data, color_space, new_width, new_height
 
-            new_data = output_buffer.getvalue()
+        except Exception:
+            # If anything fails, skip this image
+            return None
+
+    @staticmethod
+    def _replace_image(
+        writer: PdfWriter,
+        xobjects_dict,
+        obj_name,
+        image_obj,
+        new_data: bytes,
+        color_space: NameObject,
+        new_width: int,
+        new_height: int,
+    ):
+        """Swap an image for its resampled JPEG data in the writer."""
+        try:
+            new_filter = NameObject("/DCTDecode")
 
             # Create new stream object
             from pypdf.generic import DecodedStreamObject
@@ -172,14 +541,23 @@ class ImageDownscaler:
             new_stream[NameObject("/Width")] = NumberObject(new_width)
             new_stream[NameObject("/Height")] = NumberObject(new_height)
             new_stream[NameObject("/Filter")] = new_filter
-            new_stream[NameObject("/ColorSpace")] = NameObject("/DeviceRGB")
+            new_stream[NameObject("/ColorSpace")] = color_space
             new_stream[NameObject("/BitsPerComponent")] = NumberObject(8)
 
-            # Replace in XObjects dictionary
-            xobjects_dict[obj_name] = new_stream
-
-            return True
+            # Pillow round-trips Adobe (inverted) CMYK JPEGs unchanged, so
+            # any /Decode array the source needed still applies
+            if color_space == "/DeviceCMYK" and "/Decode" in image_obj:
+                new_stream[NameObject("/Decode")] = image_obj["/Decode"]
+
+            # Streams must be indirect objects. Swap the writer's copy in place
+            # so every resource dictionary sharing this image sees the new
+            # data and the full-size original is not written as an orphan.
+            reference = getattr(image_obj, "indirect_reference", None)
+            if reference is not None and reference.pdf is writer:
+                writer._replace_object(reference, new_stream)
+            else:
+                xobjects_dict[obj_name] = writer._add_object(new_stream)
 
         except Exception:
-            # If anything fails, skip this image
-            return False
+            # If anything fails, keep the original image
+            pass
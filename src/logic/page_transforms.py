@@ -4,15 +4,21 @@ Page transformation system for PDF manipulation.
 Handles global and per-page transformations with domain rules.
 """
 
-from typing import Dict, Optional, Set
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 
+# Millimetres to PostScript points (1 inch = 25.4 mm = 72 pt)
+_MM_TO_PT = 72.0 / 25.4
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Transform:
     """
     Represents a set of transformations to apply to a page.
     All measurements in millimeters, scales in percentages, rotation in degrees.
+    Frozen so instances are hashable and can be used in cache keys; slotted
+    so the many transient instances carry no per-instance __dict__.
     """
 
     h_shift_mm: float = 0.0  # Horizontal shift in mm
@@ -24,9 +30,35 @@ class Transform:
     h_scale_percent: float = 100.0  # Horizontal-only scale percentage
     v_scale_percent: float = 100.0  # Vertical-only scale percentage
 
-    def is_identity(self) -> bool:
-        """Check if this transform does nothing (all default values)."""
-        return (
+    # Computed once in __post_init__; excluded from equality and hashing
+    _identity: bool = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    h_scale_total: float = field(init=False, repr=False, compare=False)
+    v_scale_total: float = field(init=False, repr=False, compare=False)
+    shift_x_pt: float = field(init=False, repr=False, compare=False)
+    shift_y_pt: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so neither value can change after construction
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.h_shift_mm,
+                    self.v_shift_mm,
+                    self.scale_percent,
+                    self.rotation_deg,
+                    self.h_flip,
+                    self.v_flip,
+                    self.h_scale_percent,
+                    self.v_scale_percent,
+                )
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_identity",
             self.h_shift_mm == 0.0
             and self.v_shift_mm == 0.0
             and self.scale_percent == 100.0
@@ -34,8 +66,29 @@ class Transform:
             and not self.h_flip
             and not self.v_flip
             and self.h_scale_percent == 100.0
-            and self.v_scale_percent == 100.0
+            and self.v_scale_percent == 100.0,
+        )
+        # Combined scale factors and shifts in points, read per placement
+        object.__setattr__(
+            self,
+            "h_scale_total",
+            (self.h_scale_percent / 100.0) * (self.scale_percent / 100.0),
+        )
+        object.__setattr__(
+            self,
+            "v_scale_total",
+            (self.v_scale_percent / 100.0) * (self.scale_percent / 100.0),
         )
+        object.__setattr__(self, "shift_x_pt", self.h_shift_mm * _MM_TO_PT)
+        object.__setattr__(self, "shift_y_pt", self.v_shift_mm * _MM_TO_PT)
+
+    def __hash__(self) -> int:
+        # Transforms are hashed for every preview cache key
+        return self._hash
+
+    def is_identity(self) -> bool:
+        """Check if this transform does nothing (all default values)."""
+        return self._identity
 
     def merge_with(self, other: "Transform") -> "Transform":
         """
@@ -47,23 +100,55 @@ class Transform:
         return Transform(
             h_shift_mm=other.h_shift_mm if other.h_shift_mm != 0.0 else self.h_shift_mm,
             v_shift_mm=other.v_shift_mm if other.v_shift_mm != 0.0 else self.v_shift_mm,
-            scale_percent=other.scale_percent
-            if other.scale_percent != 100.0
-            else self.scale_percent,
-            rotation_deg=other.rotation_deg
-            if other.rotation_deg != 0.0
-            else self.rotation_deg,
+            scale_percent=(
+                other.scale_percent
+                if other.scale_percent != 100.0
+                else self.scale_percent
+            ),
+            rotation_deg=(
+                other.rotation_deg if other.rotation_deg != 0.0 else self.rotation_deg
+            ),
             h_flip=other.h_flip or self.h_flip,
             v_flip=other.v_flip or self.v_flip,
-            h_scale_percent=other.h_scale_percent
-            if other.h_scale_percent != 100.0
-            else self.h_scale_percent,
-            v_scale_percent=other.v_scale_percent
-            if other.v_scale_percent != 100.0
-            else self.v_scale_percent,
+            h_scale_percent=(
+                other.h_scale_percent
+                if other.h_scale_percent != 100.0
+                else self.h_scale_percent
+            ),
+            v_scale_percent=(
+                other.v_scale_percent
+                if other.v_scale_percent != 100.0
+                else self.v_scale_percent
+            ),
         )
 
 
+# Shared identity transform; compare with "is" before falling back to is_identity()
+_IDENTITY = Transform()
+
+
+def _compose(page_t: Transform, global_t: Transform) -> Transform:
+    """
+    Compound a page-level transform with the global transform.
+
+    Shifts and rotations add, scales multiply and flips toggle (XOR).
+    """
+    if global_t is _IDENTITY or global_t.is_identity():
+        return page_t
+
+    # Positional arguments in field order
+    return Transform(
+        page_t.h_shift_mm + global_t.h_shift_mm,
+        page_t.v_shift_mm + global_t.v_shift_mm,
+        page_t.scale_percent * global_t.scale_percent / 100,
+        page_t.rotation_deg + global_t.rotation_deg,
+        page_t.h_flip != global_t.h_flip,
+        page_t.v_flip != global_t.v_flip,
+        page_t.h_scale_percent * global_t.h_scale_percent / 100,
+        page_t.v_scale_percent * global_t.v_scale_percent / 100,
+    )
+
+
 class PageTransformManager:
     """
     Manages transformations for all pages in a document.
@@ -78,21 +163,59 @@ class PageTransformManager:
             total_pages: Total number of pages in the original PDF
         """
         self.total_pages = total_pages
-        self.global_transform = Transform()
+        self.global_transform = _IDENTITY
 
-        # Per-page transforms: key is page index (0-based)
-        self.page_transforms: Dict[int, Transform] = {}
+        # Per-page transforms indexed by page index (0-based); None = no override
+        self.page_transforms: List[Optional[Transform]] = [None] * total_pages
 
         # Domain transforms: special rules for even/odd pages
         self.even_pages_transform: Optional[Transform] = None
         self.odd_pages_transform: Optional[Transform] = None
 
-        # Track which pages have explicit overrides
-        self.explicit_overrides: Set[int] = set()
+        # Domain rules already composed with the global transform (or the
+        # global transform alone when no rule is set)
+        self._even_merged = _IDENTITY
+        self._odd_merged = _IDENTITY
+
+        # Resolved transforms by page index, and for the whole document;
+        # both are dropped on every change
+        self._cache: Dict[int, Transform] = {}
+        self._all_transforms: Optional[List[Transform]] = None
+
+        # Number of per-page overrides that actually change something, so
+        # has_any_transforms() does not need to scan them
+        self._nonidentity_count = 0
+        self._global_is_identity = True
+
+    @property
+    def explicit_overrides(self) -> Set[int]:
+        """Indices of pages with an explicit override."""
+        # Derived from page_transforms, so not stored twice
+        return {
+            index
+            for index, transform in enumerate(self.page_transforms)
+            if transform is not None
+        }
+
+    def _invalidate(self):
+        """Drop resolved transforms after any change to the rules."""
+        self._cache.clear()
+        self._all_transforms = None
+
+    def _recompute_merged(self):
+        """Compose the even/odd domain rules with the global transform."""
+        global_t = self.global_transform
+        even_t = self.even_pages_transform
+        odd_t = self.odd_pages_transform
+        self._even_merged = _compose(even_t, global_t) if even_t else global_t
+        self._odd_merged = _compose(odd_t, global_t) if odd_t else global_t
 
     def set_global_transform(self, transform: Transform):
         """Set the global transformation applied to all pages by default."""
         self.global_transform = transform
+        self._global_is_identity = transform.is_identity()
+        self._recompute_merged()
+        self._invalidate()
 
     def set_page_transform(
         self, page_index: int, transform: Transform, domain: str = "this"
@@ -105,25 +228,41 @@ class PageTransformManager:
             transform: The transformation to apply
             domain: One of "this", "all", "even", "odd"
         """
+        self._invalidate()
+
         if domain == "this":
             # Apply to this specific page only
-            self.page_transforms[page_index] = transform
-            self.explicit_overrides.add(page_index)
+            self._store_page_transform(page_index, transform)
 
         elif domain == "all":
             # Apply to all pages in the same position
             # For booklet layout, this means all pages at this booklet page index
             # This effectively becomes a global override
-            self.page_transforms[page_index] = transform
-            self.explicit_overrides.add(page_index)
+            self._store_page_transform(page_index, transform)
 
         elif domain == "even":
             # Apply to all even-numbered pages (0, 2, 4, ...)
             self.even_pages_transform = transform
+            self._recompute_merged()
 
         elif domain == "odd":
             # Apply to all odd-numbered pages (1, 3, 5, ...)
             self.odd_pages_transform = transform
+            self._recompute_merged()
+
+    def _store_page_transform(self, page_index: int, transform: Transform):
+        """Record an explicit override, keeping the non-identity count in step."""
+        # Padding pages in a booklet have no source page to transform
+        if page_index < 0 or page_index >= self.total_pages:
+            return
+
+        previous = self.page_transforms[page_index]
+        if previous is not None and not previous.is_identity():
+            self._nonidentity_count -= 1
+        if not transform.is_identity():
+            self._nonidentity_count += 1
+
+        self.page_transforms[page_index] = transform
 
     def get_transform_for_page(self, page_index: int) -> Transform:
         """
@@ -133,91 +272,108 @@ class PageTransformManager:
         2. Even/odd domain rules (compounds with global)
         3. Global transformation
         """
+        cached = self._cache.get(page_index)
+        if cached is not None:
+            return cached
+
         if page_index < 0 or page_index >= self.total_pages:
-            return Transform()
+            return _IDENTITY
+
+        transform = self._resolve_transform(page_index)
+        self._cache[page_index] = transform
+        return transform
+
+    def _resolve_transform(self, page_index: int) -> Transform:
+        """Compose the global transform with the page's override or domain rule."""
+        # Explicit per-page override first; with an identity global
+        # transform there is nothing to compose
+        page_t = self.page_transforms[page_index]
+        if page_t is not None:
+            if self._global_is_identity:
+                return page_t
+            return _compose(page_t, self.global_transform)
+
+        # Even/odd domain rules (or global only) are precomputed
+        if (page_index + 1) % 2 == 0:
+            return self._even_merged
+        return self._odd_merged
+
+    def get_all_transforms(self) -> List[Transform]:
+        """
+        Get the final transformation for every page in one pass.
 
-        global_t = self.global_transform
+        Pages without an explicit override only depend on their parity, so
+        they share the precomposed even/odd Transform. Use this when walking
+        the whole document (e.g. when saving) instead of calling
+        get_transform_for_page per page.
+
+        The resolved list is kept until the next change, so repeated saves
+        and previews of an unchanged document skip the pass entirely.
+
+        Returns:
+            List of transforms indexed by page index (0-based)
+        """
+        if self._all_transforms is not None:
+            return list(self._all_transforms)
 
-        # Check for explicit per-page override FIRST (highest priority)
-        if page_index in self.page_transforms:
-            page_t = self.page_transforms[page_index]
-            return Transform(
-                h_shift_mm=page_t.h_shift_mm + global_t.h_shift_mm,
-                v_shift_mm=page_t.v_shift_mm + global_t.v_shift_mm,
-                scale_percent=page_t.scale_percent * global_t.scale_percent / 100,
-                rotation_deg=page_t.rotation_deg + global_t.rotation_deg,
-                h_flip=page_t.h_flip != global_t.h_flip,  # XOR
-                v_flip=page_t.v_flip != global_t.v_flip,  # XOR
-                h_scale_percent=page_t.h_scale_percent * global_t.h_scale_percent / 100,
-                v_scale_percent=page_t.v_scale_percent * global_t.v_scale_percent / 100,
-            )
-
-        # Check for even/odd domain rules (medium priority)
-        page_number = page_index + 1
-        if page_number % 2 == 0 and self.even_pages_transform:
-            even_t = self.even_pages_transform
-            return Transform(
-                h_shift_mm=even_t.h_shift_mm + global_t.h_shift_mm,
-                v_shift_mm=even_t.v_shift_mm + global_t.v_shift_mm,
-                scale_percent=even_t.scale_percent * global_t.scale_percent / 100,
-                rotation_deg=even_t.rotation_deg + global_t.rotation_deg,
-                h_flip=even_t.h_flip != global_t.h_flip,
-                v_flip=even_t.v_flip != global_t.v_flip,
-                h_scale_percent=even_t.h_scale_percent * global_t.h_scale_percent / 100,
-                v_scale_percent=even_t.v_scale_percent * global_t.v_scale_percent / 100,
-            )
-        elif page_number % 2 == 1 and self.odd_pages_transform:
-            odd_t = self.odd_pages_transform
-            return Transform(
-                h_shift_mm=odd_t.h_shift_mm + global_t.h_shift_mm,
-                v_shift_mm=odd_t.v_shift_mm + global_t.v_shift_mm,
-                scale_percent=odd_t.scale_percent * global_t.scale_percent / 100,
-                rotation_deg=odd_t.rotation_deg + global_t.rotation_deg,
-                h_flip=odd_t.h_flip != global_t.h_flip,
-                v_flip=odd_t.v_flip != global_t.v_flip,
-                h_scale_percent=odd_t.h_scale_percent * global_t.h_scale_percent / 100,
-                v_scale_percent=odd_t.v_scale_percent * global_t.v_scale_percent / 100,
-            )
-
-        # No overrides - return global only
-        return global_t
+        # Fill by parity with slice assignment (page index 0 is page 1, odd),
+        # then overlay the explicit overrides
+        transforms: List[Transform] = [_IDENTITY] * self.total_pages
+        transforms[0::2] = [self._odd_merged] * len(range(0, self.total_pages, 2))
+        transforms[1::2] = [self._even_merged] * len(range(1, self.total_pages, 2))
+
+        for page_index, page_t in enumerate(self.page_transforms):
+            if page_t is not None:
+                transforms[page_index] = self.get_transform_for_page(page_index)
+
+        self._all_transforms = transforms
+        return list(transforms)
 
     def clear_page_transform(self, page_index: int):
         """Clear any explicit transform for a specific page."""
-        if page_index in self.page_transforms:
-            del self.page_transforms[page_index]
-        self.explicit_overrides.discard(page_index)
+        self._invalidate()
+        if page_index < 0 or page_index >= self.total_pages:
+            return
+
+        previous = self.page_transforms[page_index]
+        self.page_transforms[page_index] = None
+        if previous is not None and not previous.is_identity():
+            self._nonidentity_count -= 1
 
     def clear_domain_transforms(self):
         """Clear even/odd domain transforms."""
+        self._invalidate()
         self.even_pages_transform = None
         self.odd_pages_transform = None
+        self._recompute_merged()
 
     def clear_all_page_transforms(self):
         """Clear all per-page transforms (keeps global)."""
-        self.page_transforms.clear()
-        self.explicit_overrides.clear()
+        self._invalidate()
+        self.page_transforms = [None] * self.total_pages
+        self._nonidentity_count = 0
         self.clear_domain_transforms()
 
     def reset(self):
         """Reset everything to identity transforms."""
-        self.global_transform = Transform()
-        self.page_transforms.clear()
-        self.explicit_overrides.clear()
+        self._invalidate()
+        self.global_transform = _IDENTITY
+        self._global_is_identity = True
+        self.page_transforms = [None] * self.total_pages
+        self._nonidentity_count = 0
         self.clear_domain_transforms()
 
     def has_any_transforms(self) -> bool:
         """Check if any non-identity transforms are active."""
-        if not self.global_transform.is_identity():
-            return True
-        if self.even_pages_transform and not self.even_pages_transform.is_identity():
+        if not self._global_is_identity or self._nonidentity_count > 0:
             return True
-        if self.odd_pages_transform and not self.odd_pages_transform.is_identity():
-            return True
-        for transform in self.page_transforms.values():
-            if not transform.is_identity():
-                return True
-        return False
+
+        # Read the cached flag directly; this is polled on every GUI update
+        even_t = self.even_pages_transform
+        odd_t = self.odd_pages_transform
+        return (even_t is not None and not even_t._identity) or (
+            odd_t is not None and not odd_t._identity
+        )
 
     def get_page_only_transform(self, page_index: int) -> Transform:
         """
@@ -232,12 +388,15 @@ class PageTransformManager:
         Returns:
             The per-page transform only (identity if not set)
         """
-        if page_index in self.page_transforms:
-            return self.page_transforms[page_index]
-        return Transform()  # Identity
+        if page_index < 0 or page_index >= self.total_pages:
+            return _IDENTITY
+        return self.page_transforms[page_index] or _IDENTITY
 
 
 # Convenience function for creating transforms from GUI values (MODULE-LEVEL, not in class)
+# GUI callbacks repeat the same values constantly; Transform is frozen, so
+# identical arguments can safely share one instance
+@lru_cache(maxsize=256)
 def create_transform_from_gui(
     h_shift_mm: float = 0.0,
     v_shift_mm: float = 0.0,
@@ -252,9 +411,10 @@ def create_transform_from_gui(
     Create a Transform object from GUI widget values.
 
     This function exists to make it clear when we're converting from
-    GUI units to internal representation.
+    GUI units to internal representation. All-default values return the
+    shared identity instance.
     """
-    return Transform(
+    transform = Transform(
         h_shift_mm=h_shift_mm,
         v_shift_mm=v_shift_mm,
         scale_percent=scale_percent,
@@ -264,3 +424,4 @@ def create_transform_from_gui(
         h_scale_percent=h_scale_percent,
         v_scale_percent=v_scale_percent,
     )
+    return _IDENTITY if transform.is_identity() else transform
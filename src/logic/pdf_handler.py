@@ -1,5 +1,4 @@
 # PDFBooklet/src/logic/pdf_handler.py
-import PyPDF2
 
 
 class PDFHandler:
@@ -7,19 +6,42 @@ class PDFHandler:
 
     def __init__(self):
         self.reader = None
+        self._page_count = None
 
     def open_pdf(self, file_path):
         """Opens and loads a PDF file."""
+        # Release the previous document's native handle before replacing it
+        self.close()
+
         try:
-            self.reader = PyPDF2.PdfReader(file_path)
+            # Imported on first use: the PDF library's import chain is heavy
+            # and not needed until a file is actually opened. PyMuPDF parses
+            # the document natively, unlike a pure-Python reader
+            import fitz
+
+            self.reader = fitz.open(file_path)
+            # Read once; callers query the count repeatedly
+            self._page_count = self.reader.page_count
             return True
         except FileNotFoundError:
+            self.close()
             return False
         except Exception as e:
+            self.close()
             return False
 
+    def close(self):
+        """Closes the opened PDF, if any."""
+        if self.reader is not None:
+            try:
+                self.reader.close()
+            except Exception:
+                pass
+        self.reader = None
+        self._page_count = None
+
     def get_page_count(self):
         """Returns the number of pages in the opened PDF."""
-        if self.reader:
-            return len(self.reader.pages)
+        if self._page_count is not None:
+            return self._page_count
         return 0
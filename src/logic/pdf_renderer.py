@@ -6,13 +6,183 @@ Supports both stateful (fast, keeps PDF open) and stateless (clean) modes.
 """
 
 import fitz
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QTransform
-from PyQt6.QtCore import Qt
+import os
+import threading
+from collections import OrderedDict
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QPainter, QTransform
+from PyQt6.QtCore import Qt, QObject, QPointF, QRect, QRunnable, QThreadPool, pyqtSignal
 from typing import Tuple, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .page_transforms import Transform
 
+# Documents opened by the stateless helpers, keyed by (path, mtime) so an
+# edited file is reopened; least recently used first
+_DOC_CACHE: OrderedDict = OrderedDict()
+_DOC_CACHE_SIZE = 8
+
+# MuPDF documents are not thread-safe; hold this while using a cached one
+_DOC_CACHE_LOCK = threading.Lock()
+
+# Pixels per millimetre at zoom 1.0 (72 DPI)
+_MM_TO_PX = 72.0 / 25.4
+
+
+def _booklet_canvas_size(width_pt: float, height_pt: float, zoom: float):
+    """Side-by-side spread of two output pages."""
+    return int(width_pt * zoom * 2), int(height_pt * zoom)
+
+
+def _calendar_canvas_size(width_pt: float, height_pt: float, zoom: float):
+    """Top-bottom spread of two output pages."""
+    return int(width_pt * zoom), int(height_pt * zoom * 2)
+
+
+def _single_canvas_size(width_pt: float, height_pt: float, zoom: float):
+    """One output page."""
+    return int(width_pt * zoom), int(height_pt * zoom)
+
+
+def _booklet_slots(
+    canvas_width, canvas_height, left_idx, right_idx, left_transform, right_transform
+):
+    """Left and right halves, each clipped to its own half."""
+    half_width = canvas_width // 2
+    return (
+        (left_idx, QRect(0, 0, half_width, canvas_height), left_transform, True),
+        (
+            right_idx,
+            QRect(half_width, 0, half_width, canvas_height),
+            right_transform,
+            True,
+        ),
+    )
+
+
+def _calendar_slots(
+    canvas_width, canvas_height, top_idx, bottom_idx, top_transform, bottom_transform
+):
+    """Top and bottom halves, each clipped to its own half."""
+    half_height = canvas_height // 2
+    return (
+        (top_idx, QRect(0, 0, canvas_width, half_height), top_transform, True),
+        (
+            bottom_idx,
+            QRect(0, half_height, canvas_width, half_height),
+            bottom_transform,
+            True,
+        ),
+    )
+
+
+def _single_slots(
+    canvas_width, canvas_height, page_idx, right_idx, page_transform, right_transform
+):
+    """
+    The whole canvas, unclipped so shifted pages may go off-canvas.
+    The right page arguments are ignored.
+    """
+    return (
+        (page_idx, QRect(0, 0, canvas_width, canvas_height), page_transform, False),
+    )
+
+
+# Layout mode -> (canvas size in pixels, page slots to draw), looked up once
+# per render; unknown modes render as single pages
+_MODE_DISPATCH = {
+    "booklet": (_booklet_canvas_size, _booklet_slots),
+    "calendar": (_calendar_canvas_size, _calendar_slots),
+    "single": (_single_canvas_size, _single_slots),
+}
+
+
+class _PrefetchResults(QObject):
+    """
+    Receives spreads rendered in the background and stores them in
+    QPixmapCache. Lives on the GUI thread: QPixmap and QPixmapCache must
+    not be used from worker threads, so workers hand back QImages.
+    """
+
+    finished = pyqtSignal(str, QImage)
+
+    def __init__(self):
+        super().__init__()
+        self.pending = set()
+        self.finished.connect(self._store)
+
+    def _store(self, cache_key: str, image: QImage):
+        self.pending.discard(cache_key)
+        if not image.isNull():
+            QPixmapCache.insert(cache_key, QPixmap.fromImage(image))
+
+
+class _PrefetchTask(QRunnable):
+    """Renders one page/spread on a thread pool worker."""
+
+    def __init__(self, results: _PrefetchResults, cache_key: str, pdf_path: str, args):
+        super().__init__()
+        self.results = results
+        self.cache_key = cache_key
+        self.pdf_path = pdf_path
+        self.args = args
+
+    def run(self):
+        # MuPDF documents are not thread-safe; use a private handle
+        try:
+            doc = fitz.open(self.pdf_path)
+            try:
+                image = PDFRenderer._render_image(doc, *self.args)
+            finally:
+                doc.close()
+        except Exception as e:
+            image = QImage()
+        self.results.finished.emit(self.cache_key, image)
+
+
+class _PageCache:
+    """
+    Per-renderer caches used while rendering pages: fitted page rasters,
+    kept within PDFRenderer.PAGE_CACHE_BYTES, and MuPDF display lists, so
+    a page rasterized again at another size skips re-parsing its content.
+    Both are least recently used first.
+    """
+
+    # Display lists hold parsed page content, not pixels, so are small
+    MAX_DISPLAY_LISTS = 32
+
+    def __init__(self):
+        self.rasters: OrderedDict = OrderedDict()
+        self.display_lists: OrderedDict = OrderedDict()
+
+    def get_raster(self, key) -> Optional[QImage]:
+        image = self.rasters.get(key)
+        if image is not None:
+            self.rasters.move_to_end(key)
+        return image
+
+    def put_raster(self, key, image: QImage):
+        self.rasters[key] = image
+        total = sum(img.sizeInBytes() for img in self.rasters.values())
+        while total > PDFRenderer.PAGE_CACHE_BYTES and len(self.rasters) > 1:
+            _, evicted = self.rasters.popitem(last=False)
+            total -= evicted.sizeInBytes()
+
+    def display_list(self, doc: fitz.Document, page_idx: int) -> fitz.DisplayList:
+        display_list = self.display_lists.get(page_idx)
+        if display_list is not None:
+            self.display_lists.move_to_end(page_idx)
+            return display_list
+
+        display_list = doc.load_page(page_idx).get_displaylist()
+        self.display_lists[page_idx] = display_list
+        if len(self.display_lists) > _PageCache.MAX_DISPLAY_LISTS:
+            self.display_lists.popitem(last=False)
+        return display_list
+
+    def clear(self):
+        self.rasters.clear()
+        self.display_lists.clear()
+
 
 class PDFRenderer:
     """
@@ -21,6 +191,9 @@ class PDFRenderer:
     or stateless mode (static methods) for one-off operations.
     """
 
+    # Memory budget for each renderer's cache of rasterized, fitted pages
+    PAGE_CACHE_BYTES = 64 * 1024 * 1024
+
     def __init__(self, pdf_path: str):
         """
         Initialize renderer with a PDF file.
@@ -30,20 +203,61 @@ class PDFRenderer:
             pdf_path: Path to PDF file
         """
         self.pdf_path = pdf_path
+        self.file_sig = PDFRenderer._file_signature(pdf_path)
         self.doc = fitz.open(pdf_path)
         self.page_count = self.doc.page_count
+        self.page_size_mm = PDFRenderer._first_page_size_mm(self.doc)
+        self._closed = False
+
+        # Fitted page rasters and display lists
+        self._page_cache = _PageCache()
+
+        # Background prefetching; created on first use from the GUI thread
+        self._prefetch_pool: Optional[QThreadPool] = None
+        self._prefetch_results: Optional[_PrefetchResults] = None
 
     def close(self):
-        """Close the PDF document. Call this when done rendering."""
-        if hasattr(self, "doc") and self.doc and not self.doc.is_closed:
-            self.doc.close()
+        """Close the PDF document. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        self._page_cache.clear()
+        if self._prefetch_pool is not None:
+            # Drop queued work; renders already running use their own handle
+            self._prefetch_pool.clear()
+        self.doc.close()
+
+    def reopen_if_changed(self) -> bool:
+        """
+        Reopen the document if the file was modified since it was opened,
+        dropping everything rendered from the old version.
+
+        Returns:
+            True if the document was reopened
+        """
+        if self._closed:
+            return False
+
+        file_sig = PDFRenderer._file_signature(self.pdf_path)
+        if file_sig == self.file_sig:
+            return False
 
-    def __del__(self):
-        """Ensure document is closed on cleanup."""
         try:
-            self.close()
-        except:
-            pass  # Ignore errors during cleanup
+            doc = fitz.open(self.pdf_path)
+        except Exception as e:
+            # Mid-write or removed; keep serving the version we have
+            return False
+
+        self._page_cache.clear()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.clear()
+        self.doc.close()
+
+        self.doc = doc
+        self.file_sig = file_sig
+        self.page_count = doc.page_count
+        self.page_size_mm = PDFRenderer._first_page_size_mm(doc)
+        return True
 
     def render_page(
         self,
@@ -82,6 +296,54 @@ class PDFRenderer:
             output_height_pt,
             left_transform,
             right_transform,
+            self._page_cache,
+        )
+
+    def prefetch(
+        self,
+        cache_key: str,
+        left_idx: int,
+        right_idx: int,
+        mode: str,
+        dpi: int,
+        output_width_pt: float,
+        output_height_pt: float,
+        left_transform: Optional["Transform"] = None,
+        right_transform: Optional["Transform"] = None,
+    ):
+        """
+        Render a page/spread on a background thread and store the result in
+        QPixmapCache under cache_key, so a later request for it is a cache hit.
+        Must be called from the GUI thread.
+
+        Args:
+            cache_key: QPixmapCache key to store the rendered spread under
+            (remaining arguments as for render_page)
+        """
+        if self._closed:
+            return
+
+        if self._prefetch_results is None:
+            self._prefetch_pool = QThreadPool()
+            self._prefetch_pool.setMaxThreadCount(2)
+            self._prefetch_results = _PrefetchResults()
+
+        if cache_key in self._prefetch_results.pending:
+            return
+        self._prefetch_results.pending.add(cache_key)
+
+        args = (
+            left_idx,
+            right_idx,
+            mode,
+            dpi,
+            output_width_pt,
+            output_height_pt,
+            left_transform,
+            right_transform,
+        )
+        self._prefetch_pool.start(
+            _PrefetchTask(self._prefetch_results, cache_key, self.pdf_path, args)
         )
 
     @staticmethod
@@ -111,12 +373,17 @@ class PDFRenderer:
             QPixmap of the rendered page/spread
         """
         try:
-            doc = fitz.open(pdf_path)
-            pixmap = PDFRenderer._render_internal(
-                doc, left_idx, right_idx, mode, dpi, output_width_pt, output_height_pt
-            )
-            doc.close()
-            return pixmap
+            with _DOC_CACHE_LOCK:
+                doc = PDFRenderer._open_cached(pdf_path)
+                return PDFRenderer._render_internal(
+                    doc,
+                    left_idx,
+                    right_idx,
+                    mode,
+                    dpi,
+                    output_width_pt,
+                    output_height_pt,
+                )
         except Exception as e:
             return QPixmap()
 
@@ -131,316 +398,278 @@ class PDFRenderer:
         output_height_pt: float,
         left_transform: Optional["Transform"] = None,
         right_transform: Optional["Transform"] = None,
+        page_cache: Optional[_PageCache] = None,
     ) -> QPixmap:
         """
         Internal rendering logic shared by instance and static methods.
         """
         try:
-            # Calculate zoom factor from DPI
-            zoom = dpi / 72.0
-
-            # Determine canvas dimensions based on mode
-            if mode == "booklet":
-                # Side-by-side spread
-                canvas_width = int(output_width_pt * zoom * 2)
-                canvas_height = int(output_height_pt * zoom)
-            elif mode == "calendar":
-                # Top-bottom spread
-                canvas_width = int(output_width_pt * zoom)
-                canvas_height = int(output_height_pt * zoom * 2)
-            else:  # single
-                canvas_width = int(output_width_pt * zoom)
-                canvas_height = int(output_height_pt * zoom)
-
-            # Create blank canvas
-            combined_image = QImage(
-                canvas_width, canvas_height, QImage.Format.Format_RGB888
+            canvas_width, canvas_height = PDFRenderer._canvas_size(
+                mode, dpi, output_width_pt, output_height_pt
             )
-            combined_image.fill(Qt.GlobalColor.white)
-
-            painter = QPainter(combined_image)
-            mat = fitz.Matrix(zoom, zoom)
-
-            try:
-                if mode == "booklet":
-                    PDFRenderer._render_booklet_spread(
-                        doc,
-                        painter,
-                        mat,
-                        left_idx,
-                        right_idx,
-                        canvas_width,
-                        canvas_height,
-                        left_transform,
-                        right_transform,
-                    )
-                elif mode == "calendar":
-                    PDFRenderer._render_calendar_spread(
-                        doc,
-                        painter,
-                        mat,
-                        left_idx,
-                        right_idx,
-                        canvas_width,
-                        canvas_height,
-                        left_transform,
-                        right_transform,
-                    )
-                else:  # single
-                    PDFRenderer._render_single_page(
-                        doc,
-                        painter,
-                        mat,
-                        left_idx,
-                        canvas_width,
-                        canvas_height,
-                        left_transform,
-                    )
-            finally:
-                painter.end()
 
-            return QPixmap.fromImage(combined_image)
+            # Paint straight into the pixmap: building a QImage first would
+            # cost a full-canvas copy and format conversion in fromImage()
+            canvas = QPixmap(canvas_width, canvas_height)
+            canvas.fill(Qt.GlobalColor.white)
+
+            PDFRenderer._paint_canvas(
+                canvas,
+                doc,
+                left_idx,
+                right_idx,
+                mode,
+                dpi,
+                left_transform,
+                right_transform,
+                page_cache,
+            )
+            return canvas
         except Exception as e:
             return QPixmap()
 
     @staticmethod
-    def _render_booklet_spread(
+    def _render_image(
         doc: fitz.Document,
-        painter: QPainter,
-        matrix: fitz.Matrix,
         left_idx: int,
         right_idx: int,
-        canvas_width: int,
-        canvas_height: int,
+        mode: str,
+        dpi: int,
+        output_width_pt: float,
+        output_height_pt: float,
         left_transform: Optional["Transform"] = None,
         right_transform: Optional["Transform"] = None,
-    ):
-        """Render side-by-side booklet spread with transformations and clipping."""
-        page_count = doc.page_count
-        half_width = canvas_width // 2
-        zoom_factor = matrix.a
-
-        # Render left page
-        if 0 <= left_idx < page_count:
-            left_pix = doc.load_page(left_idx).get_pixmap(matrix=matrix, alpha=False)
-            q_left = QImage(
-                left_pix.samples,
-                left_pix.width,
-                left_pix.height,
-                left_pix.stride,
-                QImage.Format.Format_RGB888,
-            )
-
-            # Scale to fit left half FIRST
-            scaled_left = PDFRenderer._scale_image_to_fit(
-                q_left, half_width, canvas_height
+        page_cache: Optional[_PageCache] = None,
+    ) -> QImage:
+        """
+        Render a page/spread to a QImage. Unlike QPixmap, QImage may be
+        created off the GUI thread, so this is used for prefetching.
+        """
+        try:
+            canvas_width, canvas_height = PDFRenderer._canvas_size(
+                mode, dpi, output_width_pt, output_height_pt
             )
 
-            # THEN apply transformations (excluding shift)
-            if left_transform:
-                scaled_left = PDFRenderer._apply_transform_to_image_no_shift(
-                    scaled_left, left_transform, zoom_factor
-                )
-
-            # Calculate shift offset in pixels
-            h_shift_px, v_shift_px = 0, 0
-            if left_transform:
-                mm_to_px = (72.0 / 25.4) * zoom_factor
-                h_shift_px = int(left_transform.h_shift_mm * mm_to_px)
-                v_shift_px = -int(left_transform.v_shift_mm * mm_to_px)
-
-            # Center in left half, then apply shift, with clipping
-            x_offset = (half_width - scaled_left.width()) // 2 + h_shift_px
-            y_offset = (canvas_height - scaled_left.height()) // 2 + v_shift_px
-
-            painter.save()
-            painter.setClipRect(0, 0, half_width, canvas_height)
-            painter.drawImage(x_offset, y_offset, scaled_left)
-            painter.restore()
-
-        # Render right page
-        if right_idx != -1 and 0 <= right_idx < page_count:
-            right_pix = doc.load_page(right_idx).get_pixmap(matrix=matrix, alpha=False)
-            q_right = QImage(
-                right_pix.samples,
-                right_pix.width,
-                right_pix.height,
-                right_pix.stride,
-                QImage.Format.Format_RGB888,
+            # RGB32 matches QPixmap's raster format, so fromImage() on the GUI
+            # thread needs no conversion
+            canvas = QImage(canvas_width, canvas_height, QImage.Format.Format_RGB32)
+            canvas.fill(Qt.GlobalColor.white)
+
+            PDFRenderer._paint_canvas(
+                canvas,
+                doc,
+                left_idx,
+                right_idx,
+                mode,
+                dpi,
+                left_transform,
+                right_transform,
+                page_cache,
             )
+            return canvas
+        except Exception as e:
+            return QImage()
 
-            # Scale to fit right half FIRST
-            scaled_right = PDFRenderer._scale_image_to_fit(
-                q_right, half_width, canvas_height
-            )
+    @staticmethod
+    def _canvas_size(
+        mode: str, dpi: int, output_width_pt: float, output_height_pt: float
+    ) -> Tuple[int, int]:
+        """Get the canvas size in pixels for a page/spread at the given DPI."""
+        size_fn, _ = _MODE_DISPATCH.get(mode, _MODE_DISPATCH["single"])
+        return size_fn(output_width_pt, output_height_pt, dpi / 72.0)
 
-            # THEN apply transformations (excluding shift)
-            if right_transform:
-                scaled_right = PDFRenderer._apply_transform_to_image_no_shift(
-                    scaled_right, right_transform, zoom_factor
-                )
+    @staticmethod
+    def _paint_canvas(
+        canvas,
+        doc: fitz.Document,
+        left_idx: int,
+        right_idx: int,
+        mode: str,
+        dpi: int,
+        left_transform: Optional["Transform"] = None,
+        right_transform: Optional["Transform"] = None,
+        page_cache: Optional[_PageCache] = None,
+    ):
+        """Paint the page/spread onto a blank QPixmap or QImage canvas."""
+        _, slots_fn = _MODE_DISPATCH.get(mode, _MODE_DISPATCH["single"])
+        slots = slots_fn(
+            canvas.width(),
+            canvas.height(),
+            left_idx,
+            right_idx,
+            left_transform,
+            right_transform,
+        )
 
-            # Calculate shift offset in pixels
-            h_shift_px, v_shift_px = 0, 0
-            if right_transform:
-                mm_to_px = (72.0 / 25.4) * zoom_factor
-                h_shift_px = int(right_transform.h_shift_mm * mm_to_px)
-                v_shift_px = -int(right_transform.v_shift_mm * mm_to_px)
+        # Per-render constants, worked out once rather than per page slot
+        zoom_factor = dpi / 72.0
+        mm_to_px = _MM_TO_PX * zoom_factor
+        page_count = doc.page_count
 
-            # Center in right half, then apply shift, with clipping
-            x_offset = (
-                half_width + (half_width - scaled_right.width()) // 2 + h_shift_px
-            )
-            y_offset = (canvas_height - scaled_right.height()) // 2 + v_shift_px
+        painter = QPainter(canvas)
 
-            painter.save()
-            painter.setClipRect(half_width, 0, half_width, canvas_height)
-            painter.drawImage(x_offset, y_offset, scaled_right)
-            painter.restore()
+        try:
+            for page_idx, target_rect, transform, clip in slots:
+                # Missing or blank (-1) pages are skipped
+                if not 0 <= page_idx < page_count:
+                    continue
+
+                PDFRenderer._draw_page_into(
+                    painter,
+                    doc,
+                    zoom_factor,
+                    mm_to_px,
+                    page_idx,
+                    target_rect,
+                    transform,
+                    page_cache,
+                    clip,
+                )
+        finally:
+            painter.end()
 
     @staticmethod
-    def _render_calendar_spread(
-        doc: fitz.Document,
+    def _draw_page_into(
         painter: QPainter,
-        matrix: fitz.Matrix,
-        top_idx: int,
-        bottom_idx: int,
-        canvas_width: int,
-        canvas_height: int,
-        top_transform: Optional["Transform"] = None,
-        bottom_transform: Optional["Transform"] = None,
+        doc: fitz.Document,
+        zoom_factor: float,
+        mm_to_px: float,
+        page_idx: int,
+        target_rect: QRect,
+        transform: Optional["Transform"] = None,
+        page_cache: Optional[_PageCache] = None,
+        clip: bool = True,
     ):
-        """Render top-bottom calendar spread with transformations and clipping."""
-        page_count = doc.page_count
-        half_height = canvas_height // 2
-        zoom_factor = matrix.a
-
-        # Render top page
-        if 0 <= top_idx < page_count:
-            top_pix = doc.load_page(top_idx).get_pixmap(matrix=matrix, alpha=False)
-            q_top = QImage(
-                top_pix.samples,
-                top_pix.width,
-                top_pix.height,
-                top_pix.stride,
-                QImage.Format.Format_RGB888,
-            )
-
-            # Scale to fit top half FIRST
-            scaled_top = PDFRenderer._scale_image_to_fit(
-                q_top, canvas_width, half_height
-            )
+        """
+        Rasterize one page to fit target_rect, apply its transform, and draw
+        it centred in the rect plus its shift.
 
-            # THEN apply transformations (excluding shift)
-            if top_transform:
-                scaled_top = PDFRenderer._apply_transform_to_image_no_shift(
-                    scaled_top, top_transform, zoom_factor
-                )
+        Args:
+            painter: Active painter on the canvas
+            doc: Open PyMuPDF document
+            zoom_factor: Current DPI zoom factor (dpi/72)
+            mm_to_px: Pixels per millimetre at this zoom
+            page_idx: Page index to draw
+            target_rect: Canvas area the page is fitted and centred in
+            transform: Optional page transformation
+            page_cache: Optional caches owned by the renderer
+            clip: Whether to clip drawing to target_rect
+        """
+        # The default workflow hands over identity transforms for every page;
+        # treat them like no transform so nothing below touches the raster
+        if transform is not None and transform.is_identity():
+            transform = None
 
-            # Calculate shift offset in pixels
-            h_shift_px, v_shift_px = 0, 0
-            if top_transform:
-                mm_to_px = (72.0 / 25.4) * zoom_factor
-                h_shift_px = int(top_transform.h_shift_mm * mm_to_px)
-                v_shift_px = -int(top_transform.v_shift_mm * mm_to_px)
-
-            # Center in top half, then apply shift, with clipping
-            x_offset = (canvas_width - scaled_top.width()) // 2 + h_shift_px
-            y_offset = (half_height - scaled_top.height()) // 2 + v_shift_px
-
-            painter.save()
-            painter.setClipRect(0, 0, canvas_width, half_height)
-            painter.drawImage(x_offset, y_offset, scaled_top)
-            painter.restore()
-
-        # Render bottom page
-        if bottom_idx != -1 and 0 <= bottom_idx < page_count:
-            bottom_pix = doc.load_page(bottom_idx).get_pixmap(
-                matrix=matrix, alpha=False
-            )
-            q_bottom = QImage(
-                bottom_pix.samples,
-                bottom_pix.width,
-                bottom_pix.height,
-                bottom_pix.stride,
-                QImage.Format.Format_RGB888,
-            )
+        target_width = target_rect.width()
+        target_height = target_rect.height()
 
-            # Scale to fit bottom half FIRST
-            scaled_bottom = PDFRenderer._scale_image_to_fit(
-                q_bottom, canvas_width, half_height
-            )
+        # Rasterize and scale to fit target FIRST
+        image = PDFRenderer._load_scaled_page(
+            doc, page_idx, target_width, target_height, page_cache
+        )
 
-            # THEN apply transformations (excluding shift)
-            if bottom_transform:
-                scaled_bottom = PDFRenderer._apply_transform_to_image_no_shift(
-                    scaled_bottom, bottom_transform, zoom_factor
+        # THEN apply transformations (excluding shift)
+        h_shift_px, v_shift_px = 0, 0
+        resample = None
+        if transform:
+            resample = PDFRenderer._resampling_transform(transform)
+            if resample is None:
+                image = PDFRenderer._apply_transform_to_image_no_shift(
+                    image, transform, zoom_factor
                 )
 
             # Calculate shift offset in pixels
-            h_shift_px, v_shift_px = 0, 0
-            if bottom_transform:
-                mm_to_px = (72.0 / 25.4) * zoom_factor
-                h_shift_px = int(bottom_transform.h_shift_mm * mm_to_px)
-                v_shift_px = -int(bottom_transform.v_shift_mm * mm_to_px)
-
-            # Center in bottom half, then apply shift, with clipping
-            x_offset = (canvas_width - scaled_bottom.width()) // 2 + h_shift_px
+            h_shift_px = int(transform.h_shift_mm * mm_to_px)
+            v_shift_px = -int(transform.v_shift_mm * mm_to_px)
+
+        painter.save()
+        if clip:
+            painter.setClipRect(target_rect)
+        # Otherwise shifted pages may go off-canvas
+
+        if resample is not None:
+            # Resample straight onto the canvas around the target centre plus
+            # shift; transformed() would build an intermediate ARGB image that
+            # drawImage then composites in a second pass
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.translate(
+                target_rect.x() + target_width / 2 + h_shift_px,
+                target_rect.y() + target_height / 2 + v_shift_px,
+            )
+            painter.setTransform(resample, True)
+            painter.drawImage(QPointF(-image.width() / 2, -image.height() / 2), image)
+        else:
+            # Center in target, then apply shift
+            x_offset = (
+                target_rect.x() + (target_width - image.width()) // 2 + h_shift_px
+            )
             y_offset = (
-                half_height + (half_height - scaled_bottom.height()) // 2 + v_shift_px
+                target_rect.y() + (target_height - image.height()) // 2 + v_shift_px
             )
-
-            painter.save()
-            painter.setClipRect(0, half_height, canvas_width, half_height)
-            painter.drawImage(x_offset, y_offset, scaled_bottom)
-            painter.restore()
+            painter.drawImage(x_offset, y_offset, image)
+        painter.restore()
 
     @staticmethod
-    def _render_single_page(
+    def _load_scaled_page(
         doc: fitz.Document,
-        painter: QPainter,
-        matrix: fitz.Matrix,
         page_idx: int,
-        canvas_width: int,
-        canvas_height: int,
-        page_transform: Optional["Transform"] = None,
-    ):
-        """Render single page with transformations (no clipping needed)."""
-        page_count = doc.page_count
-        zoom_factor = matrix.a
-
-        if 0 <= page_idx < page_count:
-            page_pix = doc.load_page(page_idx).get_pixmap(matrix=matrix, alpha=False)
-            q_page = QImage(
-                page_pix.samples,
-                page_pix.width,
-                page_pix.height,
-                page_pix.stride,
-                QImage.Format.Format_RGB888,
-            )
+        max_width: int,
+        max_height: int,
+        page_cache: Optional[_PageCache] = None,
+    ) -> QImage:
+        """
+        Rasterize a page to fit within max dimensions.
 
-            # Scale to fit canvas FIRST
-            scaled_page = PDFRenderer._scale_image_to_fit(
-                q_page, canvas_width, canvas_height
-            )
+        MuPDF is asked for the fitted size directly rather than rasterizing
+        at canvas resolution and resampling afterwards.
 
-            # THEN apply transformations (excluding shift)
-            if page_transform:
-                scaled_page = PDFRenderer._apply_transform_to_image_no_shift(
-                    scaled_page, page_transform, zoom_factor
-                )
+        When page_cache is given, results are kept per page and target box,
+        so re-rendering a spread where only the other page (or a transform)
+        changed skips MuPDF rasterization for this page. Rasterizing at a new
+        size (e.g. after a DPI change) reuses the page's display list.
 
-            # Calculate shift offset in pixels
-            h_shift_px, v_shift_px = 0, 0
-            if page_transform:
-                mm_to_px = (72.0 / 25.4) * zoom_factor
-                h_shift_px = int(page_transform.h_shift_mm * mm_to_px)
-                v_shift_px = -int(page_transform.v_shift_mm * mm_to_px)
+        Args:
+            doc: Open PyMuPDF document
+            page_idx: Page index to render
+            max_width: Maximum width of the fitted image
+            max_height: Maximum height of the fitted image
+            page_cache: Optional caches owned by the renderer
 
-            # Center on canvas, then apply shift (can go off-canvas)
-            x_offset = (canvas_width - scaled_page.width()) // 2 + h_shift_px
-            y_offset = (canvas_height - scaled_page.height()) // 2 + v_shift_px
-            painter.drawImage(x_offset, y_offset, scaled_page)
+        Returns:
+            Scaled QImage
+        """
+        key = (page_idx, max_width, max_height)
+        if page_cache is not None:
+            cached = page_cache.get_raster(key)
+            if cached is not None:
+                return cached
+            source = page_cache.display_list(doc, page_idx)
+        else:
+            source = doc.load_page(page_idx)
+
+        rect = source.rect
+        zoom = min(max_width / rect.width, max_height / rect.height)
+
+        pix = source.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        # The QImage is only a view over the pixmap's samples; convert once so
+        # it owns its pixels before MuPDF frees the buffer. RGB32 rather than
+        # packed RGB888 keeps later drawing on Qt's native 32-bit paths
+        image = QImage(
+            pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888
+        ).convertToFormat(QImage.Format.Format_RGB32)
+        del pix
+
+        # Rounding can leave the raster a pixel over the box
+        if image.width() > max_width or image.height() > max_height:
+            scaled = PDFRenderer._scale_image_to_fit(image, max_width, max_height)
+        else:
+            scaled = image
+
+        if page_cache is not None:
+            page_cache.put_raster(key, scaled)
+
+        return scaled
 
     @staticmethod
     def _scale_image_to_fit(image: QImage, max_width: int, max_height: int) -> QImage:
@@ -490,7 +719,7 @@ class PDFRenderer:
         Returns:
             Transformed QImage
         """
-        if not transform:
+        if not transform or transform.is_identity():
             return image
 
         # Check if any transformations need to be applied (excluding shift)
@@ -504,42 +733,60 @@ class PDFRenderer:
         ):
             return image
 
-        # Create transformation matrix
+        resample = PDFRenderer._resampling_transform(transform)
+        if resample is not None:
+            return image.transformed(
+                resample, Qt.TransformationMode.SmoothTransformation
+            )
+
+        # Quarter-turn rotations and flips without scaling are exact pixel
+        # permutations; skip the interpolating resampler
+        result = image
+        if transform.rotation_deg % 360 != 0:
+            result = result.transformed(
+                QTransform().rotate(transform.rotation_deg),
+                Qt.TransformationMode.FastTransformation,
+            )
+        if transform.h_flip or transform.v_flip:
+            result = result.mirrored(transform.h_flip, transform.v_flip)
+        return result
+
+    @staticmethod
+    def _resampling_transform(transform: "Transform") -> Optional[QTransform]:
+        """
+        Get the flip/rotate/scale part of a transform as a matrix about the
+        image centre, or None when it needs no resampling (identity, or a
+        quarter-turn rotation and flips without scaling).
+
+        Args:
+            transform: Transform object with all parameters
+
+        Returns:
+            QTransform, or None if the image can be used or permuted as-is
+        """
+        h_scale = transform.h_scale_total
+        v_scale = transform.v_scale_total
+
+        if transform.rotation_deg % 90 == 0 and h_scale == 1.0 and v_scale == 1.0:
+            return None
+
         qt_transform = QTransform()
 
-        # Apply horizontal flip
+        # Apply flips
         if transform.h_flip:
             qt_transform.scale(-1, 1)
-            qt_transform.translate(-image.width(), 0)
-
-        # Apply vertical flip
         if transform.v_flip:
             qt_transform.scale(1, -1)
-            qt_transform.translate(0, -image.height())
 
-        # Apply rotation around center
+        # Apply rotation
         if transform.rotation_deg != 0:
-            qt_transform.translate(image.width() / 2, image.height() / 2)
             qt_transform.rotate(transform.rotation_deg)
-            qt_transform.translate(-image.width() / 2, -image.height() / 2)
 
         # Apply non-uniform scaling
-        h_scale = (transform.h_scale_percent / 100.0) * (
-            transform.scale_percent / 100.0
-        )
-        v_scale = (transform.v_scale_percent / 100.0) * (
-            transform.scale_percent / 100.0
-        )
-
         if h_scale != 1.0 or v_scale != 1.0:
-            qt_transform.translate(image.width() / 2, image.height() / 2)
             qt_transform.scale(h_scale, v_scale)
-            qt_transform.translate(-image.width() / 2, -image.height() / 2)
 
-        # Apply the transformation
-        return image.transformed(
-            qt_transform, Qt.TransformationMode.SmoothTransformation
-        )
+        return qt_transform
 
     @staticmethod
     def get_page_size_mm(pdf_path: str) -> Optional[Tuple[float, float]]:
@@ -553,22 +800,81 @@ class PDFRenderer:
             (width_mm, height_mm) or None on error
         """
         try:
-            doc = fitz.open(pdf_path)
-            if doc.page_count == 0:
-                doc.close()
-                return None
+            with _DOC_CACHE_LOCK:
+                doc = PDFRenderer._open_cached(pdf_path)
+                return PDFRenderer._first_page_size_mm(doc)
+        except Exception as e:
+            return None
+
+    @staticmethod
+    def _open_cached(pdf_path: str) -> fitz.Document:
+        """
+        Open a document for the stateless helpers, reusing a cached handle
+        while the file is unchanged. Call with _DOC_CACHE_LOCK held and do
+        not close the returned document.
 
-            rect = doc[0].rect
-            doc.close()
+        Args:
+            pdf_path: Path to PDF file
 
-            # Convert points to mm (1 point = 1/72 inch, 1 inch = 25.4mm)
-            width_mm = rect.width * 25.4 / 72
-            height_mm = rect.height * 25.4 / 72
+        Returns:
+            Open PyMuPDF document
+        """
+        key = (pdf_path, PDFRenderer._file_signature(pdf_path))
+        doc = _DOC_CACHE.get(key)
+        if doc is not None:
+            _DOC_CACHE.move_to_end(key)
+            return doc
+
+        # Drop handles to older versions of the same file
+        for stale in [k for k in _DOC_CACHE if k[0] == pdf_path]:
+            _DOC_CACHE.pop(stale).close()
+
+        doc = fitz.open(pdf_path)
+        _DOC_CACHE[key] = doc
+        while len(_DOC_CACHE) > _DOC_CACHE_SIZE:
+            _, evicted = _DOC_CACHE.popitem(last=False)
+            evicted.close()
+        return doc
 
-            return round(width_mm, 2), round(height_mm, 2)
-        except Exception as e:
+    @staticmethod
+    def _file_signature(pdf_path: str) -> Optional[int]:
+        """
+        Get the file's modification time in nanoseconds, used to tell when
+        cached documents and renders are stale.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            st_mtime_ns, or None if the file cannot be stat'ed
+        """
+        try:
+            return os.stat(pdf_path).st_mtime_ns
+        except OSError:
             return None
 
+    @staticmethod
+    def _first_page_size_mm(doc: fitz.Document) -> Optional[Tuple[float, float]]:
+        """
+        Get the size of the first page of an open document in millimeters.
+
+        Args:
+            doc: Open PyMuPDF document
+
+        Returns:
+            (width_mm, height_mm) or None if the document has no pages
+        """
+        if doc.page_count == 0:
+            return None
+
+        rect = doc[0].rect
+
+        # Convert points to mm (1 point = 1/72 inch, 1 inch = 25.4mm)
+        width_mm = rect.width * 25.4 / 72
+        height_mm = rect.height * 25.4 / 72
+
+        return round(width_mm, 2), round(height_mm, 2)
+
     @staticmethod
     def get_page_count(pdf_path: str) -> int:
         """
@@ -581,9 +887,7 @@ class PDFRenderer:
             Number of pages, or 0 on error
         """
         try:
-            doc = fitz.open(pdf_path)
-            count = doc.page_count
-            doc.close()
-            return count
+            with _DOC_CACHE_LOCK:
+                return PDFRenderer._open_cached(pdf_path).page_count
         except Exception as e:
             return 0
@@ -5,17 +5,75 @@ Handles all output PDF generation while preserving vector content.
 Applies transformations (shift, rotate, scale, flip) during save.
 """
 
-from pypdf import PdfWriter, PdfReader, Transformation, PageObject
-from pypdf.generic import RectangleObject
-from typing import Callable, Optional, Tuple, TYPE_CHECKING
+from pypdf import PdfWriter, PdfReader, PageObject
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 import math
-from pypdf.generic import ArrayObject, NameObject, DictionaryObject
+import os
+import time
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    IndirectObject,
+    NameObject,
+    StreamObject,
+)
 from .image_downscaler import ImageDownscaler
 
 if TYPE_CHECKING:
     from .booklet_layout import LayoutMap
     from .page_transforms import PageTransformManager
 
+# Placement content stream: clip to the target rectangle, then draw the Form
+# XObject through its CTM. Fixed-point formatting because PDF numbers may not
+# use exponents, and full float repr only bloats the stream
+_CONTENT_TMPL = (
+    b"q\n%.4f %.4f %.4f %.4f re\nW\nn\nq\n"
+    b"%.6f %.6f %.6f %.6f %.6f %.6f cm\n%s Do\nQ\nQ\n"
+)
+
+# Per source page: Form XObject reference (None for a page without content),
+# its resource name as NameObject and as bytes, the page width and height, and
+# the target width and height it was first placed in with the matching scale
+_SourceEntry = Tuple[
+    Optional[IndirectObject], NameObject, bytes, float, float, float, float, float
+]
+
+# Output file buffer; pypdf issues one small write per object and token
+_WRITE_BUFFER_BYTES = 1024 * 1024
+
+# Page keys dropped when copying a page unchanged, matching what the Form
+# XObject path carries over (content and resources only); the media box is
+# reset to the output size afterwards
+_COPY_EXCLUDED_KEYS = (
+    "/Annots",
+    "/CropBox",
+    "/BleedBox",
+    "/TrimBox",
+    "/ArtBox",
+    "/B",
+    "/StructParents",
+)
+
+
+def _snap(value: float) -> float:
+    """Snap a CTM entry within 1e-10 of a whole number (0, 1, -1...) onto it."""
+    rounded = round(value)
+    return float(rounded) if abs(value - rounded) < 1e-10 else value
+
+
+def _fit_scale(
+    src_width: float, src_height: float, target_width: float, target_height: float
+) -> float:
+    """Uniform scale that fits a source page inside a target rectangle."""
+    # Matching sizes (the usual single-page case) need no division
+    if src_width == target_width and src_height == target_height:
+        return 1.0
+    scale_x = target_width / src_width
+    scale_y = target_height / src_height
+    return scale_x if scale_x < scale_y else scale_y
+
 
 class PDFSaver:
     """
@@ -35,6 +93,7 @@ class PDFSaver:
         target_dpi: int = 300,
         progress_callback: Optional[Callable[[int, str], None]] = None,
         transform_manager: Optional["PageTransformManager"] = None,
+        downscale_workers: Optional[int] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
         Save an imposed PDF with transformations using pypdf.
@@ -50,6 +109,8 @@ class PDFSaver:
             target_dpi: Target DPI for downsampling (if enabled)
             progress_callback: Optional function(percent: int, message: str)
             transform_manager: Optional PageTransformManager for applying transforms
+            downscale_workers: Threads used to resample images (default: one
+                per CPU core)
 
         Returns:
             (success: bool, error_message: Optional[str])
@@ -67,6 +128,27 @@ class PDFSaver:
 
             total_pages = len(layout_map)
 
+            # Walk the source page tree once; placements index this list
+            source_pages = list(reader.pages)
+
+            # Per source page: Form XObject written once and referenced from
+            # every output page that places it, plus its name and size
+            source_cache: Dict[int, _SourceEntry] = {}
+
+            # Direct /Resources dictionaries shared by several source pages
+            # (inherited from the page tree), written once by id()
+            shared_resources: Dict[int, IndirectObject] = {}
+
+            # Resolve every page's transform once up front
+            page_transforms = (
+                transform_manager.get_all_transforms() if transform_manager else []
+            )
+            transform_count = len(page_transforms)
+
+            # Throttle progress updates: each one crosses into the GUI thread
+            last_percent = -1
+            last_time = 0.0
+
             # Process each page/spread in the layout
             for i, entry in enumerate(layout_map):
                 # Determine page indices
@@ -75,87 +157,92 @@ class PDFSaver:
                 else:
                     idx_a, idx_b = entry, -1
 
-                # Create new output page with correct dimensions
-                output_page = PageObject.create_blank_page(
-                    width=output_width_pt, height=output_height_pt
+                # Transforms for this page or spread (None for blanks)
+                transform_a = (
+                    page_transforms[idx_a] if 0 <= idx_a < transform_count else None
+                )
+                transform_b = (
+                    page_transforms[idx_b] if 0 <= idx_b < transform_count else None
                 )
 
-                # Place pages according to mode
-                if mode == "booklet":
-                    # Get transforms for this spread
-                    left_transform = (
-                        transform_manager.get_transform_for_page(idx_a)
-                        if (transform_manager and idx_a >= 0)
-                        else None
+                # Untransformed single pages that already have the output
+                # size are copied as they are, without a Form XObject wrapper
+                copied = mode == "single" and PDFSaver._can_copy_page(
+                    source_pages,
+                    idx_a,
+                    output_width_pt,
+                    output_height_pt,
+                    transform_a,
+                )
+
+                if copied:
+                    output_page = writer.add_page(
+                        source_pages[idx_a], excluded_keys=_COPY_EXCLUDED_KEYS
                     )
-                    right_transform = (
-                        transform_manager.get_transform_for_page(idx_b)
-                        if (transform_manager and idx_b >= 0)
-                        else None
+                else:
+                    # Create the output page in the writer itself: placements
+                    # reference objects already added to the writer, which
+                    # add_page() would duplicate when cloning a detached page
+                    output_page = writer.add_blank_page(
+                        width=output_width_pt, height=output_height_pt
                     )
 
+                # Place pages according to mode
+                if mode == "booklet":
                     PDFSaver._place_booklet_spread(
-                        reader,
+                        source_pages,
+                        writer,
+                        source_cache,
+                        shared_resources,
                         output_page,
                         idx_a,
                         idx_b,
                         output_width_pt,
                         output_height_pt,
-                        left_transform,
-                        right_transform,
+                        transform_a,
+                        transform_b,
                     )
                 elif mode == "calendar":
-                    # Get transforms for this spread
-                    top_transform = (
-                        transform_manager.get_transform_for_page(idx_a)
-                        if (transform_manager and idx_a >= 0)
-                        else None
-                    )
-                    bottom_transform = (
-                        transform_manager.get_transform_for_page(idx_b)
-                        if (transform_manager and idx_b >= 0)
-                        else None
-                    )
-
                     PDFSaver._place_calendar_spread(
-                        reader,
+                        source_pages,
+                        writer,
+                        source_cache,
+                        shared_resources,
                         output_page,
                         idx_a,
                         idx_b,
                         output_width_pt,
                         output_height_pt,
-                        top_transform,
-                        bottom_transform,
+                        transform_a,
+                        transform_b,
                     )
-                else:  # single
-                    # Get transform for this page
-                    page_transform = (
-                        transform_manager.get_transform_for_page(idx_a)
-                        if (transform_manager and idx_a >= 0)
-                        else None
-                    )
-
+                elif not copied:  # single
                     PDFSaver._place_single_page(
-                        reader,
+                        source_pages,
+                        writer,
+                        source_cache,
+                        shared_resources,
                         output_page,
                         idx_a,
                         output_width_pt,
                         output_height_pt,
-                        page_transform,
+                        transform_a,
                     )
 
-                # Add the completed page to output
                 # Ensure page size is preserved
                 output_page.mediabox.lower_left = (0, 0)
                 output_page.mediabox.upper_right = (output_width_pt, output_height_pt)
-                writer.add_page(output_page)
 
                 # Update progress
                 if progress_callback:
                     percent = int(5 + ((i + 1) / total_pages) * 90)
-                    progress_callback(
-                        percent, f"Assembling page {i + 1} of {total_pages}..."
-                    )
+                    now = time.monotonic()
+                    if percent != last_percent and now - last_time > 0.05:
+                        progress_callback(
+                            percent, f"Assembling page {i + 1} of {total_pages}..."
+                        )
+                        last_percent = percent
+                        last_time = now
 
             # Downsample images if requested
             if downscale_images:
@@ -166,13 +253,16 @@ class PDFSaver:
                     writer,
                     target_dpi=target_dpi,
                     progress_callback=None,  # Avoid nested progress updates
+                    workers=downscale_workers or os.cpu_count() or 1,
                 )
 
             if progress_callback:
                 progress_callback(95, "Writing PDF to disk...")
 
             # Write output PDF
-            with open(output_pdf_path, "wb") as output_file:
+            with open(
+                output_pdf_path, "wb", buffering=_WRITE_BUFFER_BYTES
+            ) as output_file:
                 writer.write(output_file)
 
             if progress_callback:
@@ -189,9 +279,44 @@ class PDFSaver:
                 progress_callback(0, error_msg)
             return False, error_msg
 
+    @staticmethod
+    def _can_copy_page(
+        source_pages: List[PageObject],
+        page_idx: int,
+        width_pt: float,
+        height_pt: float,
+        page_transform=None,
+    ) -> bool:
+        """
+        Check whether a page can be copied to the output unchanged: no user
+        transform, no /Rotate, and a media box at the origin that already
+        matches the output size (to the same 0.1% tolerance the placement
+        path treats as unscaled).
+        """
+        if not 0 <= page_idx < len(source_pages):
+            return False
+        if page_transform is not None and not page_transform.is_identity():
+            return False
+
+        source_page = source_pages[page_idx]
+        if source_page.rotation % 360 != 0:
+            return False
+
+        src_box = source_page.mediabox
+        if float(src_box.left) != 0 or float(src_box.bottom) != 0:
+            return False
+
+        return (
+            abs(float(src_box.width) / width_pt - 1.0) < 0.001
+            and abs(float(src_box.height) / height_pt - 1.0) < 0.001
+        )
+
     @staticmethod
     def _place_booklet_spread(
-        reader: PdfReader,
+        source_pages: List[PageObject],
+        writer: PdfWriter,
+        source_cache: Dict[int, _SourceEntry],
+        shared_resources: Dict[int, IndirectObject],
         output_page: PageObject,
         left_idx: int,
         right_idx: int,
@@ -204,22 +329,39 @@ class PDFSaver:
         half_width = width_pt / 2
 
         # Place left page
-        if 0 <= left_idx < len(reader.pages):
+        if 0 <= left_idx < len(source_pages):
             target_rect = (0, 0, half_width, height_pt)
             PDFSaver._merge_page_with_transform(
-                reader, output_page, left_idx, target_rect, left_transform
+                source_pages,
+                writer,
+                source_cache,
+                shared_resources,
+                output_page,
+                left_idx,
+                target_rect,
+                left_transform,
             )
 
         # Place right page
-        if right_idx != -1 and 0 <= right_idx < len(reader.pages):
+        if right_idx != -1 and 0 <= right_idx < len(source_pages):
             target_rect = (half_width, 0, width_pt, height_pt)
             PDFSaver._merge_page_with_transform(
-                reader, output_page, right_idx, target_rect, right_transform
+                source_pages,
+                writer,
+                source_cache,
+                shared_resources,
+                output_page,
+                right_idx,
+                target_rect,
+                right_transform,
             )
 
     @staticmethod
     def _place_calendar_spread(
-        reader: PdfReader,
+        source_pages: List[PageObject],
+        writer: PdfWriter,
+        source_cache: Dict[int, _SourceEntry],
+        shared_resources: Dict[int, IndirectObject],
         output_page: PageObject,
         top_idx: int,
         bottom_idx: int,
@@ -232,22 +374,39 @@ class PDFSaver:
         half_height = height_pt / 2
 
         # Place top page (upper half in visual terms, which is higher Y in PDF coords)
-        if 0 <= top_idx < len(reader.pages):
+        if 0 <= top_idx < len(source_pages):
             target_rect = (0, half_height, width_pt, height_pt)
             PDFSaver._merge_page_with_transform(
-                reader, output_page, top_idx, target_rect, top_transform
+                source_pages,
+                writer,
+                source_cache,
+                shared_resources,
+                output_page,
+                top_idx,
+                target_rect,
+                top_transform,
             )
 
         # Place bottom page (lower half in visual terms, which is lower Y in PDF coords)
-        if bottom_idx != -1 and 0 <= bottom_idx < len(reader.pages):
+        if bottom_idx != -1 and 0 <= bottom_idx < len(source_pages):
             target_rect = (0, 0, width_pt, half_height)
             PDFSaver._merge_page_with_transform(
-                reader, output_page, bottom_idx, target_rect, bottom_transform
+                source_pages,
+                writer,
+                source_cache,
+                shared_resources,
+                output_page,
+                bottom_idx,
+                target_rect,
+                bottom_transform,
             )
 
     @staticmethod
     def _place_single_page(
-        reader: PdfReader,
+        source_pages: List[PageObject],
+        writer: PdfWriter,
+        source_cache: Dict[int, _SourceEntry],
+        shared_resources: Dict[int, IndirectObject],
         output_page: PageObject,
         page_idx: int,
         width_pt: float,
@@ -255,15 +414,25 @@ class PDFSaver:
         page_transform=None,
     ):
         """Place single page full-size with transformations."""
-        if 0 <= page_idx < len(reader.pages):
+        if 0 <= page_idx < len(source_pages):
             target_rect = (0, 0, width_pt, height_pt)
             PDFSaver._merge_page_with_transform(
-                reader, output_page, page_idx, target_rect, page_transform
+                source_pages,
+                writer,
+                source_cache,
+                shared_resources,
+                output_page,
+                page_idx,
+                target_rect,
+                page_transform,
             )
 
     @staticmethod
     def _merge_page_with_transform(
-        reader: PdfReader,
+        source_pages: List[PageObject],
+        writer: PdfWriter,
+        source_cache: Dict[int, _SourceEntry],
+        shared_resources: Dict[int, IndirectObject],
         output_page: PageObject,
         source_idx: int,
         target_rect: tuple,  # (x0, y0, x1, y1)
@@ -273,50 +442,77 @@ class PDFSaver:
         Merge a source page onto output page with transformations and clipping using Form XObjects.
 
         Args:
-            reader: Source PDF reader
+            source_pages: Source PDF pages
+            writer: Output PDF writer the Form XObject is added to
+            source_cache: Form XObject, resource name and size per source page
+                index
+            shared_resources: Written /Resources per direct source dictionary
             output_page: Destination page object
             source_idx: Index of source page
             target_rect: Target rectangle (x0, y0, x1, y1) in points
             transform: Optional Transform object
         """
-        from pypdf.generic import (
-            DecodedStreamObject,
-            DictionaryObject,
-            ArrayObject,
-            FloatObject,
-            RectangleObject,
-        )
-
-        source_page = reader.pages[source_idx]
-
-        # Get source page dimensions
-        src_box = source_page.mediabox
-        src_width = float(src_box.width)
-        src_height = float(src_box.height)
-
         # Target rectangle dimensions
         x0, y0, x1, y1 = target_rect
         target_width = x1 - x0
         target_height = y1 - y0
 
-        # Calculate base scaling to fit target rectangle
-        scale_x = target_width / src_width
-        scale_y = target_height / src_height
-        base_scale = min(scale_x, scale_y)
+        # Create a Form XObject from the source page on first use
+        # This encapsulates the page content and resources in an isolated object
+        cached = source_cache.get(source_idx)
+        if cached is None:
+            source_page = source_pages[source_idx]
+
+            # Get source page dimensions
+            src_box = source_page.mediabox
+            src_width = float(src_box.width)
+            src_height = float(src_box.height)
+
+            form_ref = PDFSaver._add_page_form_xobject(
+                writer, source_page, src_width, src_height, shared_resources
+            )
+            # Resource name, built once per source page
+            xobj_name = f"/Fm{source_idx}"
+            cached = (
+                form_ref,
+                NameObject(xobj_name),
+                xobj_name.encode("ascii"),
+                src_width,
+                src_height,
+                target_width,
+                target_height,
+                _fit_scale(src_width, src_height, target_width, target_height),
+            )
+            source_cache[source_idx] = cached
+
+        (
+            form_ref,
+            xobj_name,
+            xobj_name_bytes,
+            src_width,
+            src_height,
+            slot_width,
+            slot_height,
+            base_scale,
+        ) = cached
+        if form_ref is None:
+            return  # Nothing to merge
+
+        # Both slots of a spread have the same size, so the scale fitting the
+        # source page into its first slot normally applies to every placement
+        if target_width != slot_width or target_height != slot_height:
+            base_scale = _fit_scale(src_width, src_height, target_width, target_height)
 
         # Calculate initial fitted dimensions (before user transforms)
         fitted_width = src_width * base_scale
         fitted_height = src_height * base_scale
 
         # Build transformation
+        is_translation = False
         if transform and not transform.is_identity():
             # User scale factors
-            h_scale = (transform.h_scale_percent / 100.0) * (
-                transform.scale_percent / 100.0
-            )
-            v_scale = (transform.v_scale_percent / 100.0) * (
-                transform.scale_percent / 100.0
-            )
+            h_scale = transform.h_scale_total
+            v_scale = transform.v_scale_total
 
             # Final scaled dimensions (before rotation)
             final_width = fitted_width * abs(h_scale)
@@ -346,29 +542,40 @@ class PDFSaver:
             if is_v_flipped:
                 rotation_deg = -rotation_deg
 
-            # Convert shift from mm to points
-            shift_x_pt = transform.h_shift_mm * 72 / 25.4
-            shift_y_pt = transform.v_shift_mm * 72 / 25.4
+            # Shift in points
+            shift_x_pt = transform.shift_x_pt
+            shift_y_pt = transform.shift_y_pt
 
             # Source center point
             src_center_x = src_width / 2
             src_center_y = src_height / 2
 
-            # Build transformation matrix
-            transformation = (
-                Transformation()
-                .translate(tx=-src_center_x, ty=-src_center_y)
-                .scale(sx=final_scale_x, sy=final_scale_y)
-            )
-
-            if rotation_deg != 0:
-                transformation = transformation.rotate(-rotation_deg)
-
             # Final position: need to account for source center
             final_x = center_x + src_center_x * base_scale * abs(h_scale) + shift_x_pt
             final_y = center_y + src_center_y * base_scale * abs(v_scale) + shift_y_pt
 
-            transformation = transformation.translate(tx=final_x, ty=final_y)
+            # Closed form of translate(-src_center) . scale . rotate(-rotation)
+            # . translate(final)
+            if rotation_deg != 0:
+                theta = math.radians(-rotation_deg)
+                cos_t = math.cos(theta)
+                sin_t = math.sin(theta)
+            else:
+                cos_t = 1.0
+                sin_t = 0.0
+
+            a = final_scale_x * cos_t
+            b = final_scale_x * sin_t
+            c = -final_scale_y * sin_t
+            d = final_scale_y * cos_t
+            ctm = (
+                a,
+                b,
+                c,
+                d,
+                final_x - src_center_x * a - src_center_y * c,
+                final_y - src_center_x * b - src_center_y * d,
+            )
         else:
             # No transform - simple scale and center
             center_x = x0 + (target_width - fitted_width) / 2
@@ -376,69 +583,101 @@ class PDFSaver:
 
             # When scale is 1.0 (content fits exactly), just translate to target origin
             if abs(base_scale - 1.0) < 0.001:
-                transformation = Transformation().translate(tx=x0, ty=y0)
+                ctm = (1.0, 0.0, 0.0, 1.0, x0, y0)
+                # A pure translation is already exact; no cleanup needed
+                is_translation = True
             else:
-                # Need to match the transform path logic
-                src_center_x = src_width / 2
-                src_center_y = src_height / 2
-
-                transformation = (
-                    Transformation()
-                    .translate(tx=-src_center_x, ty=-src_center_y)
-                    .scale(sx=base_scale, sy=base_scale)
-                    .translate(
-                        tx=center_x + fitted_width / 2, ty=center_y + fitted_height / 2
-                    )
-                )
-
-        # Get transformation matrix
-        ctm = transformation.ctm
+                # Scaling about the source centre lands its origin on the
+                # fitted rectangle's corner
+                ctm = (base_scale, 0.0, 0.0, base_scale, center_x, center_y)
 
         # Clean up floating-point errors in the CTM
         # Values very close to 0, 1, or -1 should be exact for better PDF compatibility
-        cleaned_ctm = []
-        for value in ctm:
-            if abs(value) < 1e-10:  # Essentially zero
-                cleaned_ctm.append(0.0)
-            elif abs(value - 1.0) < 1e-10:  # Essentially 1
-                cleaned_ctm.append(1.0)
-            elif abs(value + 1.0) < 1e-10:  # Essentially -1
-                cleaned_ctm.append(-1.0)
-            else:
-                cleaned_ctm.append(value)
+        if not is_translation:
+            ctm = (
+                _snap(ctm[0]),
+                _snap(ctm[1]),
+                _snap(ctm[2]),
+                _snap(ctm[3]),
+                _snap(ctm[4]),
+                _snap(ctm[5]),
+            )
 
-        ctm = tuple(cleaned_ctm)
+        # Add the Form XObject to output page's resources
+        if "/Resources" not in output_page:
+            output_page[NameObject("/Resources")] = DictionaryObject()
 
-        # Create a Form XObject from the source page
-        # This encapsulates the page content and resources in an isolated object
-        form_xobject = DictionaryObject()
-        form_xobject[NameObject("/Type")] = NameObject("/XObject")
-        form_xobject[NameObject("/Subtype")] = NameObject("/Form")
-        form_xobject[NameObject("/FormType")] = FloatObject(1)
+        if "/XObject" not in output_page["/Resources"]:
+            output_page["/Resources"][NameObject("/XObject")] = DictionaryObject()
 
-        # Set the BBox to match source page dimensions
-        form_xobject[NameObject("/BBox")] = ArrayObject(
-            [
-                FloatObject(0),
-                FloatObject(0),
-                FloatObject(src_width),
-                FloatObject(src_height),
-            ]
+        # Unique name for this Form XObject
+        output_page["/Resources"]["/XObject"][xobj_name] = form_ref
+
+        # Build content stream that references the Form XObject
+        # This applies clipping and transformation, then invokes the Form XObject
+        new_content = _CONTENT_TMPL % (
+            x0,
+            y0,
+            target_width,
+            target_height,
+            ctm[0],
+            ctm[1],
+            ctm[2],
+            ctm[3],
+            ctm[4],
+            ctm[5],
+            xobj_name_bytes,
         )
 
+        # Add this placement as its own content stream; PDF concatenates the
+        # streams in a /Contents array, so earlier placements are never
+        # re-read or copied
+        content_stream = DecodedStreamObject()
+        content_stream.set_data(new_content)
+        content_ref = writer._add_object(content_stream)
+
+        existing_contents = (
+            output_page.raw_get("/Contents") if "/Contents" in output_page else None
+        )
+        if isinstance(existing_contents, ArrayObject):
+            existing_contents.append(content_ref)
+        elif existing_contents is not None:
+            output_page[NameObject("/Contents")] = ArrayObject(
+                [existing_contents, content_ref]
+            )
+        else:
+            output_page[NameObject("/Contents")] = ArrayObject([content_ref])
+
+    @staticmethod
+    def _add_page_form_xobject(
+        writer: PdfWriter,
+        source_page: PageObject,
+        src_width: float,
+        src_height: float,
+        shared_resources: Dict[int, IndirectObject],
+    ) -> Optional[IndirectObject]:
+        """
+        Wrap a source page's content and resources in a Form XObject and add
+        it to the writer as an indirect object.
+
+        Args:
+            writer: Output PDF writer
+            source_page: Page to wrap
+            src_width: Source page width in points
+            src_height: Source page height in points
+            shared_resources: Written /Resources per direct source dictionary
+
+        Returns:
+            Reference to the Form XObject, or None if the page has no content
+        """
         # Copy the source page's content stream to the Form XObject
         source_content = source_page.get_contents()
         if source_content is None:
-            return  # Nothing to merge
-
-        source_data = source_content.get_data()
-
-        # Create a Form XObject from the source page
-        from pypdf.generic import StreamObject
+            return None
 
         # Create stream object for the Form XObject
         form_stream = StreamObject()
-        form_stream._data = source_data
+        form_stream._data = source_content.get_data()
 
         # Set Form XObject properties
         form_stream[NameObject("/Type")] = NameObject("/XObject")
@@ -455,53 +694,26 @@ class PDFSaver:
             ]
         )
 
-        # Copy the source page's resources to the Form XObject
-        if "/Resources" in source_page:
-            form_stream[NameObject("/Resources")] = source_page["/Resources"]
-
-        form_xobject = form_stream
         # Copy the source page's resources to the Form XObject
         # This isolates resources - no conflicts with output page resources
+        # Keep an indirect /Resources as a reference: cloning the resolved
+        # dictionary would both inline it and write an unused copy
         if "/Resources" in source_page:
-            form_xobject[NameObject("/Resources")] = source_page["/Resources"]
-
-        # Add the Form XObject to output page's resources
-        if "/Resources" not in output_page:
-            output_page[NameObject("/Resources")] = DictionaryObject()
-
-        if "/XObject" not in output_page["/Resources"]:
-            output_page["/Resources"][NameObject("/XObject")] = DictionaryObject()
-
-        # Generate unique name for this Form XObject
-        xobj_name = f"/Fm{source_idx}"
-        output_page["/Resources"]["/XObject"][NameObject(xobj_name)] = form_xobject
-
-        # Build content stream that references the Form XObject
-        # This applies clipping and transformation, then invokes the Form XObject
-        new_content = f"""q
-    {x0} {y0} {target_width} {target_height} re
-    W
-    n
-    q
-    {ctm[0]} {ctm[1]} {ctm[2]} {ctm[3]} {ctm[4]} {ctm[5]} cm
-    {xobj_name} Do
-    Q
-    Q
-    """.encode()
-
-        # Get existing content from output page
-        existing_content = output_page.get_contents()
-
-        if existing_content is not None:
-            # Append to existing content
-            existing_data = existing_content.get_data()
-            combined_content = existing_data + b"\n" + new_content
-        else:
-            combined_content = new_content
-
-        # Create new content stream and replace
-        content_stream = DecodedStreamObject()
-        content_stream.set_data(combined_content)
-
-        # Set the combined content
-        output_page[NameObject("/Contents")] = content_stream
+            resources = source_page.raw_get("/Resources")
+
+            # A direct dictionary is inlined into every Form that clones it;
+            # pages inheriting one from the page tree all hold the same
+            # object, so write it once and reference it instead
+            if isinstance(resources, DictionaryObject):
+                resources_ref = shared_resources.get(id(resources))
+                if resources_ref is None:
+                    resources_ref = writer._add_object(resources.clone(writer))
+                    shared_resources[id(resources)] = resources_ref
+                resources = resources_ref
+
+            form_stream[NameObject("/Resources")] = resources
+
+        # Clone into the writer so objects the resources reference (fonts,
+        # images) are imported from the reader; _add_object() alone would
+        # leave them pointing into the source file
+        return writer._add_object(form_stream.clone(writer))
@@ -1,9 +1,14 @@
 # PDFBooklet/src/logic/unit_converter.py
+
+# Millimetres per inch
+_MM_PER_IN = 25.4
+
+
 def mm_to_inches(mm_value: float) -> float:
     """Converts a value from millimeters to inches."""
-    return mm_value / 25.4
+    return mm_value / _MM_PER_IN
 
 
 def inches_to_mm(inches_value: float) -> float:
     """Converts a value from inches to millimeters."""
-    return inches_value * 25.4
+    return inches_value * _MM_PER_IN
@@ -0,0 +1,39 @@
+# PDFBooklet/tests/unit/test_pdf_saver.py
+import os
+import tempfile
+import unittest
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import NameObject, NumberObject
+
+from src.logic.pdf_saver import PDFSaver
+
+
+class TestSaveBooklet(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_single_mode_with_indirect_rotate(self):
+        # /Rotate may be stored as an indirect reference
+        writer = PdfWriter()
+        page = writer.add_blank_page(width=595, height=842)
+        page[NameObject("/Rotate")] = writer._add_object(NumberObject(0))
+        source_path = os.path.join(self.tmp_dir, "source.pdf")
+        with open(source_path, "wb") as source_file:
+            writer.write(source_file)
+
+        output_path = os.path.join(self.tmp_dir, "output.pdf")
+        success, error = PDFSaver.save_booklet(
+            source_path, output_path, [0], "single", 595, 842
+        )
+
+        self.assertTrue(success, error)
+        self.assertEqual(len(PdfReader(output_path).pages), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()